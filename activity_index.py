@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Activity Index - Persistent index of activity lines in memory/*.md
+Remembers each file's mtime/size and the lines already extracted from it,
+so only new or changed files are read again
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+WORKSPACE = Path.home() / ".openclaw" / "workspace"
+MEMORY_DIR = WORKSPACE / "memory"
+INDEX_FILE = WORKSPACE / ".cache" / "activity_index.json"
+
+# A line counts as activity if it contains any of these (case-insensitive)
+ACTIVITY_KEYWORDS = ("created", "built", "updated", "added", "completed")
+INDEX_VERSION = 1
+
+def extract_activities(content, keywords=ACTIVITY_KEYWORDS):
+    """Return the stripped lines of content that mention an activity keyword"""
+    return [
+        line.strip() for line in content.split("\n")
+        if any(keyword in line.lower() for keyword in keywords)
+    ]
+
+class ActivityIndex:
+    """Incrementally maintained activity lines per memory file"""
+
+    def __init__(self, memory_dir=MEMORY_DIR, path=INDEX_FILE, keywords=ACTIVITY_KEYWORDS):
+        self.memory_dir = Path(memory_dir)
+        self.path = Path(path) if path else None
+        self.keywords = tuple(keywords)
+        self._files = {}   # file name -> {"mtime_ns", "size", "lines"}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        # A different keyword list means the stored extractions are wrong
+        if data.get("version") == INDEX_VERSION and data.get("keywords") == list(self.keywords):
+            self._files = data.get("files", {})
+
+    def save(self):
+        """Write the index back to disk (atomic replace)"""
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps({
+                "version": INDEX_VERSION,
+                "keywords": list(self.keywords),
+                "files": self._files,
+            })
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def refresh(self):
+        """Re-scan new or changed files and forget deleted ones; returns files re-read"""
+        try:
+            entries = [e for e in os.scandir(self.memory_dir) if e.name.endswith(".md") and e.is_file()]
+        except OSError:
+            entries = []
+
+        rescanned = 0
+        with self._lock:
+            seen = set()
+            for entry in entries:
+                seen.add(entry.name)
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                cached = self._files.get(entry.name)
+                if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+                    continue
+                try:
+                    content = Path(entry.path).read_text()
+                except (OSError, UnicodeDecodeError):
+                    continue
+                self._files[entry.name] = {
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "lines": extract_activities(content, self.keywords),
+                }
+                rescanned += 1
+
+            removed = [name for name in self._files if name not in seen]
+            for name in removed:
+                del self._files[name]
+
+        if rescanned or removed:
+            self.save()
+        return rescanned
+
+    def _iter(self, max_files=None):
+        """(date, text) newest file first, lines in file order"""
+        with self._lock:
+            names = sorted(self._files, reverse=True)[:max_files]
+            files = [(name, self._files[name]["lines"]) for name in names]
+        for name, lines in files:
+            date = name[:-len(".md")]
+            for line in lines:
+                yield {"date": date, "text": line}
+
+    def recent(self, limit=10, max_files=None):
+        """The newest `limit` activities (optionally from the newest max_files files)"""
+        activities = []
+        for activity in self._iter(max_files):
+            activities.append(activity)
+            if len(activities) >= limit:
+                break
+        return activities
+
+    def between(self, start, end):
+        """Activities from files dated start..end inclusive (ISO date strings)"""
+        return [a for a in self._iter() if start <= a["date"] <= end]
+
+    def search(self, keyword, limit=None):
+        """Activities whose text contains keyword (case-insensitive), newest first"""
+        keyword = keyword.lower()
+        matches = []
+        for activity in self._iter():
+            if keyword in activity["text"].lower():
+                matches.append(activity)
+                if limit and len(matches) >= limit:
+                    break
+        return matches
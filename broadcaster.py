@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Broadcaster - Server-Sent Events fan-out for the dashboard server
+Each event is encoded once and shared by every connected client. Clients get
+a bounded queue; one that falls behind has its backlog replaced by a single
+"resync" event instead of holding memory or blocking publishers
+"""
+
+import itertools
+import json
+import queue
+import threading
+import time
+
+QUEUE_SIZE = 32       # pending events per client before it counts as slow
+KEEPALIVE = 15        # seconds between comment pings on an idle stream
+RETRY_MS = 3000       # client reconnect delay hint
+
+def encode_event(event, data, event_id=None):
+    """Encode one SSE message as bytes"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    payload = json.dumps(data, separators=(",", ":"))
+    lines.extend(f"data: {line}" for line in payload.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+class Subscription:
+    """One connected client's queue of encoded events"""
+
+    def __init__(self, size):
+        self.queue = queue.Queue(maxsize=size)
+        self.dropped = 0
+        self.connected_at = time.time()
+        # Publishers run on many threads; a concurrent put between another
+        # offer's drain and its resync could otherwise lose the resync
+        self._lock = threading.Lock()
+
+    def offer(self, message, resync):
+        """Queue a message; if the client is behind, collapse its backlog to a resync"""
+        with self._lock:
+            try:
+                self.queue.put_nowait(message)
+                return True
+            except queue.Full:
+                pass
+            # Drain whatever is pending - the client will refetch full state instead
+            while True:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    break
+            self.queue.put_nowait(resync)  # can't be full: only offers add, and we hold the lock
+            return False
+
+class Broadcaster:
+    """Publish events once, deliver them to every subscriber"""
+
+    def __init__(self, queue_size=QUEUE_SIZE, keepalive=KEEPALIVE, max_clients=None):
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self.max_clients = max_clients  # each open stream holds a server worker
+        self.refused = 0
+        self.published = 0
+        self.slow_clients = 0
+        self._ids = itertools.count(1)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def publish(self, event, data):
+        """Encode once and fan out to all subscribers (never blocks)"""
+        event_id = next(self._ids)
+        message = encode_event(event, data, event_id)
+        resync = encode_event("resync", {"reason": "slow client"}, event_id)
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self.published += 1
+        slow = sum(1 for subscription in subscribers if not subscription.offer(message, resync))
+        if slow:
+            with self._lock:
+                self.slow_clients += slow
+        return event_id
+
+    def close(self):
+        """End every open stream (server shutdown)"""
+        with self._lock:
+            self._closed = True
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.offer(None, None)
+
+    def subscribe(self):
+        """A new subscription, or None if max_clients streams are already open"""
+        subscription = Subscription(self.queue_size)
+        with self._lock:
+            if self.max_clients is not None and len(self._subscribers) >= self.max_clients:
+                self.refused += 1
+                return None
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stream(self, subscription, hello=None):
+        """
+        Generator of SSE bytes for one client. Unsubscribes when the client
+        goes away (the server closes the generator on disconnect).
+        """
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode()
+            if hello is not None:
+                yield encode_event("hello", hello)
+            while not self._closed:
+                try:
+                    message = subscription.queue.get(timeout=self.keepalive)
+                except queue.Empty:
+                    yield b": keepalive\n\n"
+                    continue
+                if message is None:
+                    break
+                yield message
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self):
+        with self._lock:
+            clients = len(self._subscribers)
+        return {
+            "clients": clients,
+            "published": self.published,
+            "slow_clients": self.slow_clients,
+            "refused": self.refused,
+        }
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Calendar Store - Local SQLite mirror of calendar events and reminders
+Source adapters (macOS Calendar via osascript, remindctl, ICS files, JSON
+files) fill one table indexed by start time. Each adapter reports a cheap
+change token (usually file mtimes), so a sync only re-reads sources that
+changed and "today's events" is an indexed range query
+"""
+
+import hashlib
+import json
+import shutil
+import sqlite3
+import subprocess
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+import ics_reader
+import timeservice
+
+DB_FILE = Path.home() / ".config" / "daystarter" / "calendar.db"
+# .ics files dropped here (e.g. by vdirsyncer) are read without any config
+ICS_DIR = Path.home() / ".config" / "daystarter" / "calendars"
+
+# Re-sync a source with no change token at most this often (seconds)
+SYNC_INTERVAL = 5 * 60
+
+Item = namedtuple("Item", ["uid", "kind", "start", "all_day", "title", "data"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    source   TEXT NOT NULL,
+    uid      TEXT NOT NULL,
+    kind     TEXT NOT NULL,          -- 'event' or 'reminder'
+    start    REAL NOT NULL,          -- epoch seconds (event start / reminder due)
+    all_day  INTEGER NOT NULL DEFAULT 0,
+    title    TEXT NOT NULL,
+    data     TEXT,                   -- JSON extras (display time, reminder fields)
+    PRIMARY KEY (source, uid)
+);
+CREATE INDEX IF NOT EXISTS items_kind_start ON items (kind, start);
+CREATE TABLE IF NOT EXISTS sync_state (
+    source    TEXT PRIMARY KEY,
+    token     TEXT,
+    synced_at REAL
+);
+"""
+
+def day_window(day=None):
+    """(start, end) epoch seconds of a calendar day in the user's time zone"""
+    start, end = timeservice.day_window(day)
+    return start.timestamp(), end.timestamp()
+
+def _uid(*parts):
+    return hashlib.sha1("\x1f".join(str(p) for p in parts).encode()).hexdigest()[:16]
+
+def _mtime_token(paths):
+    """Token from (path, mtime, size) of existing files, or None if none exist"""
+    entries = []
+    for path in paths:
+        try:
+            st = Path(path).stat()
+        except OSError:
+            continue
+        entries.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(sorted(entries)) or None
+
+def _parse_datetime(value):
+    """ISO 8601 string (or epoch number) -> epoch seconds, None if unparseable"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed.timestamp()
+
+# --- Source adapters -------------------------------------------------------
+#
+# An adapter has a unique `name`, says whether it is `windowed` (reports only
+# the requested day, like osascript) or returns everything it has (files),
+# and implements:
+#   change_token(window) -> str or None   cheap; None means "can't tell"
+#   fetch(window)        -> list of Item  raises on failure
+
+class OsascriptCalendar:
+    """Today's events from macOS Calendar (includes synced Google calendars)"""
+
+    name = "osascript-calendar"
+    kind = "event"
+    windowed = True
+    # Calendar's local store - touched whenever any calendar syncs
+    STORE_FILES = [
+        Path.home() / "Library" / "Calendars" / "Calendar.sqlitedb",
+        Path.home() / "Library" / "Calendars" / "Calendar Cache",
+        Path.home() / "Library" / "Group Containers" / "group.com.apple.calendar" / "Calendar.sqlitedb",
+    ]
+
+    SCRIPT = """
+    tell application "Calendar"
+        set todayDate to current date
+        set time of todayDate to 0
+        set tomorrowDate to todayDate + (1 * days)
+
+        set eventList to ""
+
+        repeat with cal in every calendar
+            try
+                set calEvents to every event of cal whose start date ≥ todayDate and start date < tomorrowDate
+                repeat with currentEvent in calEvents
+                    set eventTitle to summary of currentEvent
+                    set eventStart to start date of currentEvent
+                    set eventTime to time string of eventStart
+                    set eventOffset to (eventStart - todayDate) as integer
+                    set eventUid to uid of currentEvent
+                    set eventList to eventList & eventTime & "\t" & eventTitle & "\t" & eventOffset & "\t" & eventUid & "\n"
+                end repeat
+            end try
+        end repeat
+
+        return eventList
+    end tell
+    """
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+
+    @staticmethod
+    def available():
+        return shutil.which("osascript") is not None
+
+    def change_token(self, window):
+        token = _mtime_token(self.STORE_FILES)
+        return f"{window[0]}:{token}" if token else None
+
+    def fetch(self, window):
+        result = subprocess.run(
+            ["osascript", "-e", self.SCRIPT],
+            capture_output=True,
+            text=True,
+            timeout=self.timeout
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "osascript failed")
+
+        items = []
+        for line in result.stdout.strip().split("\n"):
+            parts = line.split("\t")
+            if len(parts) < 2:
+                continue
+            event_time, title = parts[0], parts[1]
+            try:
+                offset = int(parts[2])
+            except (IndexError, ValueError):
+                offset = 0
+            uid = parts[3] if len(parts) > 3 and parts[3] else _uid(event_time, title)
+            items.append(Item(_uid(uid, offset), "event", window[0] + offset, False, title,
+                              {"time": event_time}))
+        return items
+
+class RemindctlReminders:
+    """Today's reminders from Apple Reminders via remindctl"""
+
+    name = "remindctl"
+    kind = "reminder"
+    windowed = True
+    STORE_GLOB = (Path.home() / "Library" / "Reminders" / "Container_v1" / "Stores", "*.sqlite*")
+
+    def __init__(self, timeout=8):
+        self.timeout = timeout
+
+    @staticmethod
+    def available():
+        return shutil.which("remindctl") is not None
+
+    def change_token(self, window):
+        directory, pattern = self.STORE_GLOB
+        token = _mtime_token(sorted(directory.glob(pattern))) if directory.exists() else None
+        return f"{window[0]}:{token}" if token else None
+
+    def fetch(self, window):
+        result = subprocess.run(
+            ["remindctl", "list", "--today", "--json"],
+            capture_output=True,
+            text=True,
+            timeout=self.timeout
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "remindctl failed")
+
+        items = []
+        for index, reminder in enumerate(json.loads(result.stdout or "[]")):
+            due = _parse_datetime(reminder.get("due"))
+            # remindctl --today includes overdue items - keep them on today
+            start = min(max(due or window[0], window[0]), window[1] - 1)
+            uid = reminder.get("id") or _uid(reminder.get("list"), reminder.get("name"), index)
+            items.append(Item(str(uid), "reminder", start, due is None,
+                              reminder.get("name", "Untitled"), reminder))
+        return items
+
+class ICSFileAdapter:
+    """
+    Events from a local .ics file or a directory of them (exports, CalDAV
+    dumps). Streamed by ics_reader, so only the requested window is expanded.
+    """
+
+    kind = "event"
+    windowed = True
+
+    def __init__(self, path):
+        self.path = Path(path).expanduser()
+        self.name = f"ics:{self.path}"
+
+    def change_token(self, window):
+        files = _mtime_token([self.path, *ics_reader.iter_ics_files(self.path)])
+        return f"{window[0]}:{files}" if files else None
+
+    def fetch(self, window):
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        start, end = (datetime.fromtimestamp(t, timezone.utc) for t in window)
+        items = []
+        for occurrence, all_day, title, uid in ics_reader.occurrences([self.path], start, end):
+            stamp = occurrence.timestamp()
+            items.append(Item(_uid(uid or title, stamp), "event", stamp, all_day, title, {}))
+        return items
+
+class JSONFileAdapter:
+    """
+    Events/reminders from a JSON file: a list of objects with "title" (or
+    "name"), "start" (or "due", ISO 8601), optional "uid", "kind" and
+    "all_day". Other fields are kept and returned with reminders.
+    """
+
+    windowed = False
+
+    def __init__(self, path, kind="event"):
+        self.path = Path(path).expanduser()
+        self.kind = kind
+        self.name = f"json:{kind}:{self.path}"  # the same file may be listed for both kinds
+
+    def change_token(self, window):
+        return _mtime_token([self.path])
+
+    def fetch(self, window):
+        items = []
+        for index, entry in enumerate(json.loads(self.path.read_text())):
+            start = _parse_datetime(entry.get("start", entry.get("due")))
+            if start is None:
+                continue
+            title = entry.get("title") or entry.get("name") or "Untitled"
+            uid = entry.get("uid") or _uid(title, start, index)
+            items.append(Item(str(uid), entry.get("kind", self.kind), start,
+                              bool(entry.get("all_day")), title, entry))
+        return items
+
+def default_adapters(config=None):
+    """Adapters for this machine plus any ICS/JSON files listed in config"""
+    adapters = []
+    if OsascriptCalendar.available():
+        adapters.append(OsascriptCalendar())
+    if RemindctlReminders.available():
+        adapters.append(RemindctlReminders())
+    ics_paths = list(getattr(config, "CALENDAR_ICS_FILES", []))
+    if ICS_DIR.is_dir():
+        ics_paths.append(ICS_DIR)
+    for path in dict.fromkeys(str(Path(p).expanduser()) for p in ics_paths):
+        adapters.append(ICSFileAdapter(path))
+    for path in getattr(config, "CALENDAR_JSON_FILES", []):
+        adapters.append(JSONFileAdapter(path, "event"))
+    for path in getattr(config, "REMINDER_JSON_FILES", []):
+        adapters.append(JSONFileAdapter(path, "reminder"))
+    return adapters
+
+# --- Store -------------------------------------------------------------------
+
+class CalendarStore:
+    """SQLite mirror of events and reminders, synced incrementally from adapters"""
+
+    def __init__(self, path=DB_FILE, sync_interval=SYNC_INTERVAL):
+        self.path = Path(path)
+        self.sync_interval = sync_interval
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+
+    def _connect(self):
+        """One connection per thread (sqlite3 connections aren't shared)"""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _state(self, db, source):
+        row = db.execute("SELECT token, synced_at FROM sync_state WHERE source = ?", (source,)).fetchone()
+        return row or (None, 0)
+
+    def sync_adapter(self, adapter, window=None, now=None):
+        """Re-read one source if its change token moved; returns True if it was re-read"""
+        window = window or day_window()
+        now = now or time.time()
+        db = self._connect()
+        old_token, synced_at = self._state(db, adapter.name)
+
+        token = adapter.change_token(window)
+        if token is None:
+            # No way to tell if it changed - re-read at most every sync_interval (and each new day)
+            token = f"{window[0]}:unknown"
+            if token == old_token and now - synced_at < self.sync_interval:
+                return False
+        elif token == old_token:
+            return False
+
+        try:
+            items = adapter.fetch(window)
+        except Exception:
+            return False  # keep the last good copy
+
+        rows = [(adapter.name, item.uid, item.kind, item.start, int(item.all_day), item.title,
+                 json.dumps(item.data, default=str) if item.data else None) for item in items]
+        with db:
+            if adapter.windowed:
+                db.execute("DELETE FROM items WHERE source = ? AND start >= ? AND start < ?",
+                           (adapter.name, window[0], window[1]))
+            else:
+                db.execute("DELETE FROM items WHERE source = ?", (adapter.name,))
+            db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (adapter.name, token, now))
+        return True
+
+    def _forget_other_sources(self, names):
+        """Drop mirrored items from sources that are no longer configured"""
+        db = self._connect()
+        placeholders = ",".join("?" * len(names))
+        with db:
+            sources = [row[0] for row in db.execute(
+                f"SELECT DISTINCT source FROM items WHERE source NOT IN ({placeholders})", list(names))]
+            for source in sources:
+                db.execute("DELETE FROM items WHERE source = ?", (source,))
+                db.execute("DELETE FROM sync_state WHERE source = ?", (source,))
+
+    def sync(self, adapters, window=None, kind=None):
+        """Sync every adapter (optionally only those of one kind); returns sources re-read"""
+        with self._sync_lock:
+            # Judged against every configured source, not just this kind's: a JSON
+            # file's entries can carry their own "kind", so item kinds say nothing
+            # about which sync owns a source
+            self._forget_other_sources([adapter.name for adapter in adapters])
+            return [adapter.name for adapter in adapters
+                    if (kind is None or adapter.kind == kind) and self.sync_adapter(adapter, window)]
+
+    def between(self, kind, start, end):
+        """Items of a kind starting in [start, end), ordered by start"""
+        rows = self._connect().execute(
+            "SELECT uid, kind, start, all_day, title, data FROM items "
+            "WHERE kind = ? AND start >= ? AND start < ? ORDER BY start, title",
+            (kind, start, end)
+        ).fetchall()
+        return [Item(uid, kind, start, bool(all_day), title, json.loads(data) if data else {})
+                for uid, kind, start, all_day, title, data in rows]
+
+    def today_events(self):
+        """Today's events as (time, title) tuples"""
+        events = []
+        for item in self.between("event", *day_window()):
+            if item.all_day:
+                label = "All day"
+            else:
+                label = item.data.get("time") or timeservice.local(item.start).strftime("%H:%M")
+            events.append((label, item.title))
+        return events
+
+    def today_reminders(self):
+        """Today's reminders as remindctl-style dicts"""
+        reminders = []
+        for item in self.between("reminder", *day_window()):
+            reminder = dict(item.data)
+            reminder.setdefault("name", item.title)
+            reminders.append(reminder)
+        return reminders
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_store():
+    """Shared store for this process"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CalendarStore()
+    return _store
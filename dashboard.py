@@ -4,24 +4,38 @@ Jarvis Dashboard - Visual Kanban Board and Project Tracking
 Generates an HTML dashboard for viewing in browser
 """
 
+import hashlib
+import os
 import re
-from datetime import datetime
+import tempfile
+import threading
+import time
 from pathlib import Path
 from html import escape as html_escape
 
+from activity_index import ActivityIndex
+import timeservice
+
 # Paths
 WORKSPACE = Path.home() / ".openclaw" / "workspace"
 KANBAN_FILE = WORKSPACE / "KANBAN.md"
 MEMORY_DIR = WORKSPACE / "memory"
 DASHBOARD_FILE = WORKSPACE / "DASHBOARD.html"
+ACTIVITY_INDEX_FILE = WORKSPACE / ".cache" / "activity_index.json"
 
-def parse_kanban():
-    """Parse KANBAN.md into structured data"""
-    if not KANBAN_FILE.exists():
-        return {"todo": [], "in_progress": [], "blocked": [], "done": []}
+# Last parse of KANBAN.md, keyed on (mtime, size) and content hash
+_kanban_cache = {"stat": None, "digest": None, "sections": None}
+_kanban_lock = threading.Lock()
+
+_activity_index = None
+_activity_index_lock = threading.Lock()
 
-    content = KANBAN_FILE.read_text()
-    sections = {"todo": [], "in_progress": [], "blocked": [], "done": []}
+def _empty_kanban():
+    return {"todo": [], "in_progress": [], "blocked": [], "done": []}
+
+def parse_kanban_text(content):
+    """Parse KANBAN.md content into structured data"""
+    sections = _empty_kanban()
 
     current_section = None
     for line in content.split('\n'):
@@ -45,28 +59,55 @@ def parse_kanban():
 
     return sections
 
+def parse_kanban():
+    """
+    Parse KANBAN.md into structured data.
+    The result is cached and reused until the file's mtime/size change and
+    its content hash differs, so treat it as read-only.
+    """
+    try:
+        st = KANBAN_FILE.stat()
+    except OSError:
+        return _empty_kanban()
+
+    stat_key = (st.st_mtime_ns, st.st_size)
+    # A file modified within the last second could change again without
+    # moving its mtime, so only trust the stat key for older files
+    stat_is_settled = time.time() - st.st_mtime > 1
+
+    with _kanban_lock:
+        if stat_is_settled and _kanban_cache["stat"] == stat_key:
+            return _kanban_cache["sections"]
+
+        content = KANBAN_FILE.read_text()
+        digest = hashlib.sha1(content.encode()).hexdigest()
+        if digest != _kanban_cache["digest"]:
+            _kanban_cache["sections"] = parse_kanban_text(content)
+            _kanban_cache["digest"] = digest
+        _kanban_cache["stat"] = stat_key
+        return _kanban_cache["sections"]
+
+def get_activity_index():
+    """Shared activity index over MEMORY_DIR, loaded on first use"""
+    global _activity_index
+    with _activity_index_lock:
+        if _activity_index is None:
+            _activity_index = ActivityIndex(MEMORY_DIR, ACTIVITY_INDEX_FILE)
+    return _activity_index
+
 def parse_memory_files():
-    """Get recent activity from memory files"""
+    """Get recent activity from memory files (newest 7 files, top 10 lines)"""
     if not MEMORY_DIR.exists():
         return []
 
-    activities = []
-    for file in sorted(MEMORY_DIR.glob("*.md"), reverse=True)[:7]:
-        content = file.read_text()
-        for line in content.split('\n'):
-            if any(keyword in line.lower() for keyword in ['created', 'built', 'updated', 'added', 'completed']):
-                activities.append({
-                    "date": file.stem,
-                    "text": line.strip()
-                })
-                if len(activities) >= 10:
-                    break
+    index = get_activity_index()
+    index.refresh()
+    return index.recent(10, max_files=7)
 
-    return activities[:10]
-
-def calculate_project_progress():
-    """Calculate progress for ongoing projects"""
-    kanban = parse_kanban()
+def calculate_project_progress(kanban=None):
+    """Calculate progress for ongoing projects (pass an already-parsed kanban to skip re-parsing)"""
+    if kanban is None:
+        kanban = parse_kanban()
 
     projects = {}
     for task in kanban["in_progress"]:
@@ -139,241 +180,213 @@ def activity_html(activities):
 
     return ''.join(html_parts)
 
-def generate_html():
-    """Generate HTML dashboard"""
-    kanban = parse_kanban()
-    activities = parse_memory_files()
-    projects = calculate_project_progress()
-
-    last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Stats counts
-    done_count = len(kanban["done"])
-    in_progress_count = len(kanban["in_progress"])
-    todo_count = len(kanban["todo"])
-    active_projects_count = len(projects)
-
-    # Task HTML
-    todo_html = task_html(kanban["todo"])
-    in_progress_html = task_html(kanban["in_progress"])
-    blocked_html = task_html(kanban["blocked"])
-    done_html = task_html(kanban["done"])
-
-    # Add "more" link for done tasks
-    if done_count > 10:
-        more_html = f'<div class="task completed">... and {done_count - 10} more</div>'
-        done_html += more_html
-
-    # Other HTML sections
-    project_html_str = project_html(projects)
-    activity_html_str = activity_html(activities)
-
-    html = f"""<!DOCTYPE html>
+# Page shell with $slot placeholders, compiled once at import (see compile_template)
+PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Jarvis Dashboard</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
             color: #e4e4e7;
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
 
-        header {{
+        header {
             text-align: center;
             padding: 40px 0;
             border-bottom: 1px solid #2d3748;
             margin-bottom: 40px;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 2.5em;
             color: #61dafb;
             margin-bottom: 10px;
-        }}
+        }
 
-        .subtitle {{
+        .subtitle {
             color: #8b9dc3;
             font-size: 1.1em;
-        }}
+        }
 
-        .refresh-time {{
+        .refresh-time {
             color: #6b7280;
             font-size: 0.9em;
             margin-top: 10px;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 50px;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.5em;
             color: #61dafb;
             margin-bottom: 20px;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
 
-        .emoji {{
+        .emoji {
             font-size: 1.2em;
-        }}
+        }
 
-        .kanban-board {{
+        .kanban-board {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 20px;
-        }}
+        }
 
-        .column {{
+        .column {
             background: #1f2937;
             border-radius: 10px;
             padding: 20px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .column-title {{
+        .column-title {
             font-size: 1.2em;
             color: #e4e4e7;
             margin-bottom: 15px;
             padding-bottom: 10px;
             border-bottom: 2px solid #374151;
-        }}
+        }
 
-        .todo {{ border-bottom-color: #f59e0b; }}
-        .in-progress {{ border-bottom-color: #3b82f6; }}
-        .blocked {{ border-bottom-color: #ef4444; }}
-        .done {{ border-bottom-color: #10b981; }}
+        .todo { border-bottom-color: #f59e0b; }
+        .in-progress { border-bottom-color: #3b82f6; }
+        .blocked { border-bottom-color: #ef4444; }
+        .done { border-bottom-color: #10b981; }
 
-        .task {{
+        .task {
             background: #374151;
             padding: 12px;
             margin-bottom: 10px;
             border-radius: 6px;
             font-size: 0.95em;
-        }}
+        }
 
-        .task.completed {{
+        .task.completed {
             text-decoration: line-through;
             opacity: 0.6;
-        }}
+        }
 
-        .task-list {{
+        .task-list {
             min-height: 100px;
-        }}
+        }
 
-        .project-card {{
+        .project-card {
             background: #374151;
             border-radius: 10px;
             padding: 20px;
             margin-bottom: 15px;
             box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-        }}
+        }
 
-        .project-name {{
+        .project-name {
             font-size: 1.1em;
             font-weight: 600;
             margin-bottom: 10px;
-        }}
+        }
 
-        .progress-bar {{
+        .progress-bar {
             background: #1f2937;
             border-radius: 10px;
             height: 10px;
             overflow: hidden;
             margin-bottom: 5px;
-        }}
+        }
 
-        .progress-fill {{
+        .progress-fill {
             background: linear-gradient(90deg, #61dafb 0%, #3b82f6 100%);
             height: 100%;
             transition: width 0.3s ease;
             border-radius: 10px;
-        }}
+        }
 
-        .progress-text {{
+        .progress-text {
             color: #8b9dc3;
             font-size: 0.9em;
-        }}
+        }
 
-        .activity-log {{
+        .activity-log {
             background: #1f2937;
             border-radius: 10px;
             padding: 20px;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .activity-item {{
+        .activity-item {
             padding: 15px 0;
             border-bottom: 1px solid #374151;
             display: flex;
             gap: 15px;
-        }}
+        }
 
-        .activity-item:last-child {{
+        .activity-item:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .activity-date {{
+        .activity-date {
             color: #6b7280;
             font-size: 0.9em;
             min-width: 100px;
-        }}
+        }
 
-        .activity-text {{
+        .activity-text {
             color: #e4e4e7;
             font-size: 0.95em;
-        }}
+        }
 
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: #1f2937;
             border-radius: 10px;
             padding: 20px;
             text-align: center;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2em;
             font-weight: bold;
             color: #61dafb;
             margin-bottom: 5px;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             color: #8b9dc3;
             font-size: 0.9em;
-        }}
+        }
 
-        .empty {{
+        .empty {
             text-align: center;
             color: #6b7280;
             padding: 40px 0;
             font-style: italic;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -381,7 +394,7 @@ def generate_html():
         <header>
             <h1>🤖 Jarvis Dashboard</h1>
             <div class="subtitle">Bob's AI Assistant - Task & Project Tracking</div>
-            <div class="refresh-time">Last updated: {last_updated}</div>
+            <div class="refresh-time" id="last-updated">Last updated: $last_updated</div>
         </header>
 
         <!-- Stats -->
@@ -389,19 +402,19 @@ def generate_html():
             <h2 class="section-title"><span class="emoji">📊</span> Quick Stats</h2>
             <div class="stats">
                 <div class="stat-card">
-                    <div class="stat-value">{done_count}</div>
+                    <div class="stat-value" id="stat-done">$done_count</div>
                     <div class="stat-label">Tasks Completed</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{in_progress_count}</div>
+                    <div class="stat-value" id="stat-in_progress">$in_progress_count</div>
                     <div class="stat-label">In Progress</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{todo_count}</div>
+                    <div class="stat-value" id="stat-todo">$todo_count</div>
                     <div class="stat-label">To Do</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{active_projects_count}</div>
+                    <div class="stat-value" id="stat-active_projects">$active_projects_count</div>
                     <div class="stat-label">Active Projects</div>
                 </div>
             </div>
@@ -414,32 +427,32 @@ def generate_html():
                 <!-- To Do -->
                 <div class="column todo">
                     <div class="column-title">📋 To Do</div>
-                    <div class="task-list">
-                        {todo_html}
+                    <div class="task-list" id="list-todo">
+                        $todo_html
                     </div>
                 </div>
 
                 <!-- In Progress -->
                 <div class="column in-progress">
                     <div class="column-title">🔄 In Progress</div>
-                    <div class="task-list">
-                        {in_progress_html}
+                    <div class="task-list" id="list-in_progress">
+                        $in_progress_html
                     </div>
                 </div>
 
                 <!-- Blocked -->
                 <div class="column blocked">
                     <div class="column-title">⏸️ Blocked</div>
-                    <div class="task-list">
-                        {blocked_html}
+                    <div class="task-list" id="list-blocked">
+                        $blocked_html
                     </div>
                 </div>
 
                 <!-- Done -->
                 <div class="column done">
                     <div class="column-title">✅ Done</div>
-                    <div class="task-list">
-                        {done_html}
+                    <div class="task-list" id="list-done">
+                        $done_html
                     </div>
                 </div>
             </div>
@@ -448,27 +461,226 @@ def generate_html():
         <!-- Active Projects -->
         <div class="section">
             <h2 class="section-title"><span class="emoji">🚀</span> Active Projects</h2>
-            {project_html_str}
+            <div id="projects">
+                $project_html_str
+            </div>
         </div>
 
         <!-- Recent Activity -->
         <div class="section">
             <h2 class="section-title"><span class="emoji">📜</span> Recent Activity Log</h2>
-            <div class="activity-log">
-                {activity_html_str}
+            <div class="activity-log" id="activity">
+                $activity_html_str
             </div>
         </div>
     </div>
 
     <script>
-        // Auto-refresh every 5 minutes
-        setTimeout(() => location.reload(), 300000);
+        // Patch sections in place as the server pushes board changes (SSE), or
+        // poll for the ones changed since this page's version without SSE.
+        // Opened as a file there is no API - reload.
+        const board = {epoch: "$board_epoch", version: $board_version};
+        const REFRESH_MS = 60000;
+
+        function el(tag, cls, text) {
+            const node = document.createElement(tag);
+            if (cls) node.className = cls;
+            if (text !== undefined) node.textContent = text;
+            return node;
+        }
+
+        function taskNodes(tasks, showMore) {
+            if (!tasks.length) return [el('div', 'empty', 'No tasks')];
+            const nodes = tasks.slice(0, 10).map(t => el('div', t.completed ? 'task completed' : 'task', t.task));
+            if (showMore && tasks.length > 10) {
+                nodes.push(el('div', 'task completed', '... and ' + (tasks.length - 10) + ' more'));
+            }
+            return nodes;
+        }
+
+        function projectNodes(projects) {
+            if (!projects.length) return [el('div', 'empty', 'No active projects')];
+            return projects.map(p => {
+                const card = el('div', 'project-card');
+                const bar = el('div', 'progress-bar');
+                const fill = el('div', 'progress-fill');
+                fill.style.width = p.progress + '%';
+                bar.append(fill);
+                card.append(el('div', 'project-name', p.name), bar,
+                    el('div', 'progress-text', p.progress + '% Complete (' + p.completed + '/' + p.total + ' tasks)'));
+                return card;
+            });
+        }
+
+        function activityNodes(activities) {
+            if (!activities.length) return [el('div', 'empty', 'No recent activity')];
+            return activities.map(a => {
+                const item = el('div', 'activity-item');
+                item.append(el('div', 'activity-date', a.date), el('div', 'activity-text', a.text));
+                return item;
+            });
+        }
+
+        function patch(id, nodes) {
+            document.getElementById(id).replaceChildren(...nodes);
+        }
+
+        const renderers = {
+            stats: s => Object.keys(s).forEach(k => document.getElementById('stat-' + k).textContent = s[k]),
+            todo: d => patch('list-todo', taskNodes(d)),
+            in_progress: d => patch('list-in_progress', taskNodes(d)),
+            blocked: d => patch('list-blocked', taskNodes(d)),
+            done: d => patch('list-done', taskNodes(d, true)),
+            projects: d => patch('projects', projectNodes(d)),
+            activity: d => patch('activity', activityNodes(d)),
+        };
+
+        function applyDelta(delta) {
+            for (const name in delta.sections) {
+                if (renderers[name]) renderers[name](delta.sections[name].data);
+            }
+            if (Object.keys(delta.sections).length) {
+                document.getElementById('last-updated').textContent = 'Last updated: ' + delta.updated;
+            }
+            board.epoch = delta.epoch;
+            board.version = delta.version;
+        }
+
+        async function refreshBoard() {
+            const url = '/api/board?since=' + board.version + '&epoch=' + encodeURIComponent(board.epoch);
+            const res = await fetch(url, {cache: 'no-store'});
+            if (res.ok) applyDelta(await res.json());
+        }
+
+        function listen() {
+            const events = new EventSource('/api/events');
+            events.addEventListener('board', e => {
+                const delta = JSON.parse(e.data);
+                // A delta only applies on top of the version it was computed from
+                if (delta.epoch === board.epoch && delta.since === board.version) applyDelta(delta);
+                else if (delta.version !== board.version) refreshBoard().catch(() => {});
+            });
+            // (Re)connected or fell behind: catch up on anything missed
+            events.addEventListener('hello', () => refreshBoard().catch(() => {}));
+            events.addEventListener('resync', () => refreshBoard().catch(() => {}));
+            // Refused (server at its stream limit) or gone for good: poll instead
+            events.onerror = () => {
+                if (events.readyState === EventSource.CLOSED) poll();
+            };
+        }
+
+        let polling = null;
+        function poll() {
+            if (polling === null) polling = setInterval(() => refreshBoard().catch(() => {}), REFRESH_MS);
+        }
+
+        if (location.protocol === 'file:') {
+            // Auto-refresh every 5 minutes
+            setTimeout(() => location.reload(), 300000);
+        } else if (window.EventSource) {
+            listen();
+        } else {
+            poll();
+        }
     </script>
 </body>
 </html>
 """
 
-    DASHBOARD_FILE.write_text(html)
+SLOT_PATTERN = re.compile(r"\$(\w+)")
+
+def compile_template(template):
+    """Split a $slot template into (static byte chunks, slot names)"""
+    parts = SLOT_PATTERN.split(template)
+    return tuple(part.encode("utf-8") for part in parts[0::2]), tuple(parts[1::2])
+
+_PAGE_STATIC, _PAGE_SLOTS = compile_template(PAGE_TEMPLATE)
+
+def board_data():
+    """Structured dashboard data (the JSON behind /api/board), keyed by section"""
+    kanban = parse_kanban()
+    activities = parse_memory_files()
+    projects = calculate_project_progress(kanban)
+
+    return {
+        "stats": {
+            "done": len(kanban["done"]),
+            "in_progress": len(kanban["in_progress"]),
+            "todo": len(kanban["todo"]),
+            "active_projects": len(projects),
+        },
+        "todo": kanban["todo"],
+        "in_progress": kanban["in_progress"],
+        "blocked": kanban["blocked"],
+        "done": kanban["done"],
+        "projects": [dict(data, name=name) for name, data in projects.items()],
+        "activity": activities,
+    }
+
+def render_fragments(board=None, version=("", 0), updated=None):
+    """
+    Build the dynamic parts of the page, keyed by template slot. updated is
+    when the board last changed (default: now) - the live server passes it so
+    re-renders of an unchanged board come out byte-identical, ETag and all
+    """
+    if board is None:
+        board = board_data()
+    stats = board["stats"]
+    done_count = stats["done"]
+
+    # Add "more" link for done tasks
+    done_html = task_html(board["done"])
+    if done_count > 10:
+        done_html += f'<div class="task completed">... and {done_count - 10} more</div>'
+
+    return {
+        "last_updated": updated or timeservice.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "done_count": done_count,
+        "in_progress_count": stats["in_progress"],
+        "todo_count": stats["todo"],
+        "active_projects_count": stats["active_projects"],
+        "todo_html": task_html(board["todo"]),
+        "in_progress_html": task_html(board["in_progress"]),
+        "blocked_html": task_html(board["blocked"]),
+        "done_html": done_html,
+        "project_html_str": project_html({p["name"]: p for p in board["projects"]}),
+        "activity_html_str": activity_html(board["activity"]),
+        "board_epoch": version[0],
+        "board_version": version[1],
+    }
+
+def iter_html(board=None, version=("", 0), updated=None):
+    """
+    Yield the dashboard as UTF-8 byte chunks: cached static shell around
+    dynamic fragments. version is the (epoch, version) of board, which the
+    page sends back to /api/board to fetch only what changed since.
+    """
+    fragments = render_fragments(board, version, updated)
+    for static, slot in zip(_PAGE_STATIC, _PAGE_SLOTS):
+        yield static
+        yield str(fragments[slot]).encode("utf-8")
+    yield _PAGE_STATIC[-1]
+
+def render_html():
+    """Render the dashboard HTML as a string"""
+    return b"".join(iter_html()).decode("utf-8")
+
+def generate_html():
+    """Generate HTML dashboard and write it to DASHBOARD_FILE"""
+    # Write a unique temp file and rename so a browser never sees a half-written
+    # page, and concurrent runs never write into each other's temp file
+    fd, tmp_path = tempfile.mkstemp(dir=DASHBOARD_FILE.parent, prefix=DASHBOARD_FILE.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(iter_html())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, DASHBOARD_FILE)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
     return DASHBOARD_FILE
 
 def main():
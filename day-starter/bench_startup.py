@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - How long `daystarter --cached` takes to draw the screen
+Runs the CLI under `python -X importtime` a few times, reports wall-clock time
+above a bare interpreter, the slowest imports, and any heavy module that
+crept into the snapshot-only path. Exits 1 on a regression so it can gate CI
+
+    python3 bench_startup.py                 # 7 runs, 50 ms budget
+    python3 bench_startup.py --runs 15 --budget-ms 40 --top 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "daystarter.py")
+CLI_ARGS = ["--cached", "--non-interactive"]
+BUDGET_MS = 50
+
+# Modules the --cached path has no business importing
+FORBIDDEN = [
+    "threading", "concurrent.futures", "sqlite3", "http.client",
+    "xml.etree.ElementTree", "pathlib", "tempfile",
+    "calendar_store", "feed_ingest", "hn_client", "response_cache", "note_journal",
+    "subprocess", "stock_prices", "pandas", "yfinance",
+]
+
+def run(argv):
+    """Run once; returns (wall seconds, stderr text)"""
+    started = time.perf_counter()
+    result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        sys.exit(f"{' '.join(argv)} exited {result.returncode}:\n{result.stderr[-2000:]}")
+    return elapsed, result.stderr
+
+def parse_importtime(stderr):
+    """[(name, self_us, cumulative_us, depth)] from -X importtime output"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+def median_run(argv, runs):
+    times = []
+    stderr = ""
+    for _ in range(runs):
+        elapsed, stderr = run(argv)
+        times.append(elapsed)
+    return statistics.median(times), stderr
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help="allowed time above bare interpreter startup")
+    parser.add_argument("--top", type=int, default=12, help="slowest imports to list")
+    args = parser.parse_args()
+
+    # Interpreter + site startup is the floor nothing in the CLI can change
+    base_time, base_err = median_run([sys.executable, "-X", "importtime", "-c", "pass"], args.runs)
+    baseline = {name for name, _, _, _ in parse_importtime(base_err)}
+
+    cli_time, cli_err = median_run([sys.executable, "-X", "importtime", CLI, *CLI_ARGS], args.runs)
+    imports = [i for i in parse_importtime(cli_err) if i[0] not in baseline]
+    overhead_ms = (cli_time - base_time) * 1000
+
+    print(f"bare interpreter:   {base_time * 1000:6.1f} ms")
+    print(f"daystarter --cached: {cli_time * 1000:6.1f} ms  ({overhead_ms:+.1f} ms, budget {args.budget_ms:.0f} ms)")
+    print(f"modules imported:   {len(imports)} beyond the interpreter's own")
+
+    print("\nSlowest top-level imports (cumulative):")
+    top_level = sorted((i for i in imports if i[3] == 0), key=lambda i: i[2], reverse=True)
+    for name, self_us, cumulative_us, depth in top_level[:args.top]:
+        print(f"  {cumulative_us / 1000:6.1f} ms  {name}")
+
+    failures = []
+    heavy = sorted({name for name, _, _, _ in imports if name in FORBIDDEN})
+    if heavy:
+        failures.append(f"heavy modules on the --cached path: {', '.join(heavy)}")
+    if overhead_ms > args.budget_ms:
+        failures.append(f"{overhead_ms:.1f} ms over the interpreter is above the {args.budget_ms:.0f} ms budget")
+
+    if failures:
+        print("\n✗ " + "\n✗ ".join(failures))
+        sys.exit(1)
+    print("\n✓ Within budget")
+
+if __name__ == "__main__":
+    main()
@@ -29,3 +29,24 @@ FINANCE_KEYWORDS = [
     "buyback", "acquisition", "merger", "wall street", "premarket", "after hours",
     "sec filing", "quarterly", "annual report", "revenue", "profit", "loss"
 ]
+
+# Your time zone (IANA name) - sets "today" for the header, calendar, notes
+# and the overnight news window
+TIMEZONE = "Australia/Sydney"
+
+# Global time budget for the morning screen (seconds) - sections still
+# loading after this show a placeholder instead of blocking the rest
+FETCH_DEADLINE = 20
+
+# How often `daystarter --serve` rebuilds the prefetched morning snapshot (seconds)
+SNAPSHOT_INTERVAL = 15 * 60
+
+# How often the dashboard server polls the stock watchlist while the US
+# market is open (seconds)
+STOCK_POLL_INTERVAL = 60
+
+# Extra calendar/reminder sources mirrored into the local calendar store
+# (macOS Calendar and remindctl are picked up automatically when installed)
+CALENDAR_ICS_FILES = []     # .ics files or directories, e.g. ["~/Calendars/work.ics", "~/.calendars/work"]
+CALENDAR_JSON_FILES = []    # [{"title": ..., "start": "2026-02-01T09:00:00"}, ...]
+REMINDER_JSON_FILES = []    # [{"name": ..., "due": "...", "list": ...}, ...]
@@ -4,12 +4,17 @@ Day Starter CLI - Your daily command center
 Shows weather, calendar, reminders, and overnight news
 """
 
-import json
 import os
-import subprocess
 import sys
-from datetime import datetime
-from pathlib import Path
+
+# Shared workspace modules live one level up
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Everything else is imported by the sections that use it, so rendering the
+# prefetched snapshot (--cached) doesn't pay for network, SQLite or threads
+import timeservice
+from snapshot_store import (SERVE_INTERVAL, load_fresh, load_today, prefetch, render_snapshot,
+                            save_snapshot, serve)
 
 # Import config
 try:
@@ -30,29 +35,29 @@ except ImportError:
         ]
     config = Config()
 
+# One clock for every section: the header, calendar day, notes and news window
+timeservice.set_timezone(getattr(config, 'TIMEZONE', timeservice.DEFAULT_TIMEZONE))
+
 # Config paths
-CONFIG_DIR = Path.home() / ".config" / "daystarter"
-NOTES_DIR = Path.home() / "Documents" / "DayStarters"
+CONFIG_DIR = os.path.expanduser("~/.config/daystarter")
+NOTES_DIR = os.path.expanduser("~/Documents/DayStarters")
 
 def ensure_dirs():
     """Create necessary directories"""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    NOTES_DIR.mkdir(parents=True, exist_ok=True)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    os.makedirs(NOTES_DIR, exist_ok=True)
 
 def get_weather():
     """Get weather from multiple sources with robust fallbacks"""
+    from response_cache import cached_json, cached_text
+
     errors = []
 
     # Try 1: Full format with wttr.in (primary)
     try:
-        result = subprocess.run(
-            ["curl", "-s", "--max-time", "5", "wttr.in/Sydney?format=%l:+%c+%t+%w"],
-            capture_output=True,
-            text=True,
-            timeout=6
-        )
-        if result.returncode == 0 and result.stdout:
-            weather = result.stdout.strip()
+        weather = cached_text("weather", "https://wttr.in/Sydney?format=%l:+%c+%t+%w", timeout=5)
+        if weather:
+            weather = weather.strip()
             if weather and "Unknown" not in weather and len(weather) > 3:
                 return weather
         else:
@@ -62,14 +67,9 @@ def get_weather():
 
     # Try 2: Simple format with wttr.in (fallback 1)
     try:
-        result = subprocess.run(
-            ["curl", "-s", "--max-time", "4", "wttr.in/Sydney?format=%C+%t"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout:
-            weather = result.stdout.strip()
+        weather = cached_text("weather", "https://wttr.in/Sydney?format=%C+%t", timeout=4)
+        if weather:
+            weather = weather.strip()
             if weather and "Unknown" not in weather and len(weather) > 3:
                 return f"Sydney: {weather}"
         else:
@@ -80,16 +80,12 @@ def get_weather():
     # Try 3: Open-Meteo as backup (fallback 2)
     try:
         # Sydney coordinates
-        result = subprocess.run(
-            ["curl", "-s", "--max-time", "4",
-             "https://api.open-meteo.com/v1/forecast?latitude=-33.87&longitude=151.21&current_weather=true"],
-            capture_output=True,
-            text=True,
-            timeout=5
+        data = cached_json(
+            "weather",
+            "https://api.open-meteo.com/v1/forecast?latitude=-33.87&longitude=151.21&current_weather=true",
+            timeout=4
         )
-        if result.returncode == 0 and result.stdout:
-            import json
-            data = json.loads(result.stdout)
+        if data:
             if "current_weather" in data:
                 cw = data["current_weather"]
                 temp = cw.get("temperature", "?")
@@ -116,56 +112,15 @@ def get_weather():
     return f"Weather unavailable ({error_summary})"
 
 def get_calendar_events():
-    """Get today's calendar events from macOS Calendar (works with Google Calendar)"""
+    """Get today's calendar events from the local mirror (macOS Calendar, ICS and JSON sources)"""
     try:
-        # Use AppleScript to query all calendars
-        script = """
-        tell application "Calendar"
-            set todayDate to current date
-            set time of todayDate to 0
-            set tomorrowDate to todayDate + (1 * days)
-
-            set eventList to ""
-
-            repeat with cal in every calendar
-                try
-                    set calEvents to every event of cal whose start date ≥ todayDate and start date < tomorrowDate
-                    repeat with currentEvent in calEvents
-                        set eventTitle to summary of currentEvent
-                        set eventStart to start date of currentEvent
-                        set eventTime to time string of eventStart
-                        set eventList to eventList & eventTime & "\t" & eventTitle & "\n"
-                    end repeat
-                end try
-            end repeat
-
-            return eventList
-        end tell
-        """
-
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=8
-        )
+        import calendar_store
 
-        if result.returncode == 0 and result.stdout.strip():
-            events = []
-            for line in result.stdout.strip().split('\n'):
-                if '\t' in line:
-                    parts = line.split('\t')
-                    if len(parts) >= 2:
-                        time = parts[0]
-                        event = parts[1]
-                        events.append((time, event))
-            return events
-    except subprocess.TimeoutExpired:
-        return None  # Timeout is handled gracefully
-    except Exception as e:
-        # Silent failure - return None and let caller handle display
-        pass
-    return None
+        store = calendar_store.get_store()
+        store.sync(calendar_store.default_adapters(config), kind="event")
+        return store.today_events() or None
+    except Exception:
+        return None  # Silent failure - let caller handle display
 
 def format_calendar(events):
     """Format calendar events for display"""
@@ -177,8 +132,14 @@ def format_calendar(events):
             lines.append(f"  🕐 {time} - {event}")
     return "\n".join(lines)
 
-def get_newsapi_news():
-    """Fetch news from NewsAPI.org"""
+def get_newsapi_news(dedupe=None, since=None):
+    """
+    Fetch news from NewsAPI.org (skipping headlines in the dedupe index, and
+    articles published before `since` epoch seconds, if given)
+    """
+    from keyword_matcher import matcher_for
+    from response_cache import cached_json
+
     news_items = []
 
     if not hasattr(config, 'NEWS_API_KEY') or not config.NEWS_API_KEY:
@@ -186,32 +147,30 @@ def get_newsapi_news():
 
     categories = getattr(config, 'NEWS_CATEGORIES', ['business', 'technology'])
     max_articles = getattr(config, 'MAX_ARTICLES', 5)
-    keywords = getattr(config, 'FINANCE_KEYWORDS', [])
+    matcher = matcher_for(getattr(config, 'FINANCE_KEYWORDS', []))
 
     for category in categories:
         try:
             url = f"https://newsapi.org/v2/top-headlines?category={category}&language=en&apiKey={config.NEWS_API_KEY}"
-            result = subprocess.run(
-                ["curl", "-s", "--max-time", "10", url],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-
-            if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
+            data = cached_json("news", url, timeout=10)
 
+            if data:
                 if data.get("status") == "ok" and "articles" in data:
                     for article in data["articles"]:
                         title = article.get("title", "")
                         source = article.get("source", {}).get("name", "News")
                         description = article.get("description", "")
+                        published = timeservice.parse_timestamp(article.get("publishedAt"))
+                        if since and published and published < since:
+                            continue
 
                         # Combine title and description for better filtering
-                        full_text = f"{title} {description}".lower()
+                        full_text = f"{title} {description}"
 
                         # Filter for finance/tech/telco content
-                        if title and any(kw.lower() in full_text for kw in keywords):
+                        if title and matcher.search(full_text):
+                            if dedupe and dedupe.is_duplicate(title):
+                                continue
                             news_items.append((source, title))
                             if len(news_items) >= max_articles:
                                 break
@@ -224,6 +183,10 @@ def get_newsapi_news():
 
 def get_overnight_news():
     """Get overnight finance/tech/telco news via RSS - fast and reliable with fallbacks"""
+    from dedupe_index import DedupeIndex
+    from feed_ingest import ingest_feeds
+    from hn_client import HNClient
+    from keyword_matcher import matcher_for
 
     # RSS feeds for US/UK finance and tech news (overnight for Sydney)
     rss_feeds = [
@@ -242,109 +205,57 @@ def get_overnight_news():
         "ai", "artificial intelligence", "tech", "startup", "funding",
         "fed", "federal reserve", "interest rate", "inflation", "economy"
     ]
+    matcher = matcher_for(keywords)
 
     news_items = []
-    seen_titles = set()
     feed_errors = []
-
-    for source, url in rss_feeds:
+    # Near-duplicate headline index, shared across runs
+    dedupe = DedupeIndex()
+    # Only what was published since the ASX close - the UK and US sessions
+    window_start = timeservice.overnight_window()[0]
+    since = window_start.timestamp()
+
+    # Fetch every feed at once (conditional GET, unchanged feeds served locally);
+    # changed feeds are stream-parsed only up to their first 5 overnight items,
+    # and abandoned as soon as they reach older stories
+    for source, records, error in ingest_feeds(rss_feeds, limit=5, timeout=4, since=since):
         if len(news_items) >= 8:
             break
 
-        try:
-            # Quick fetch with short timeout
-            result = subprocess.run(
-                ["curl", "-s", "-L", "--max-time", "4", "-A", "DayStarter/1.0", url],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
-                feed_errors.append(f"{source}: fetch failed")
-                continue
-
-            if not result.stdout or len(result.stdout) < 100:
-                feed_errors.append(f"{source}: empty response")
-                continue
-
-            # Parse RSS XML
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(result.stdout)
-
-            # Handle RSS 2.0 and Atom formats
-            items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-
-            if not items:
-                feed_errors.append(f"{source}: no items")
-                continue
-
-            for item in items[:5]:  # Check first 5 items from each feed
-                if len(news_items) >= 8:
-                    break
-
-                # Get title
-                title_elem = item.find('title')
-                if title_elem is None:
-                    title_elem = item.find('.//{http://www.w3.org/2005/Atom}title')
-                if title_elem is None or title_elem.text is None:
-                    continue
-
-                title = title_elem.text.strip()
-
-                # Skip duplicates
-                title_lower = title.lower()
-                if any(title_lower in seen or seen in title_lower for seen in seen_titles):
-                    continue
-
-                # Check for relevant keywords
-                title_words = title_lower.split()
-                if any(kw in title_lower or any(kw in word for word in title_words) for kw in keywords):
-                    # Clean up title
-                    title = title.replace('<![CDATA[', '').replace(']]>', '').strip()
-                    # Decode HTML entities
-                    import html
-                    title = html.unescape(title)
-                    if title and len(title) > 15:  # Skip very short titles
-                        news_items.append((source, title))
-                        seen_titles.add(title_lower)
+        if error:
+            feed_errors.append(f"{source}: {error}")
+            continue
 
-        except Exception as e:
-            feed_errors.append(f"{source}: {str(e)[:30]}")
+        if not records:
+            feed_errors.append(f"{source}: nothing since {window_start:%a %H:%M}")
             continue
 
-    # If we got nothing from RSS, try a quick web scrape of Hacker News
+        for record in records:
+            if len(news_items) >= 8:
+                break
+
+            title = record.title
+
+            # Check for relevant keywords (whole words, so "ai" doesn't hit "said")
+            if matcher.search(title):
+                # Skip very short titles and syndicated/already-shown duplicates
+                if len(title) > 15 and not dedupe.is_duplicate(title):
+                    news_items.append((source, title))
+
+    # If we got nothing from RSS, try Hacker News
     if not news_items:
-        try:
-            result = subprocess.run(
-                ["curl", "-s", "--max-time", "3", "https://hacker-news.firebaseio.com/v0/topstories.json"],
-                capture_output=True,
-                text=True,
-                timeout=4
-            )
-            if result.returncode == 0 and result.stdout:
-                import json
-                story_ids = json.loads(result.stdout)[:5]
-                for story_id in story_ids:
-                    try:
-                        story_result = subprocess.run(
-                            ["curl", "-s", "--max-time", "2",
-                             f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"],
-                            capture_output=True,
-                            text=True,
-                            timeout=3
-                        )
-                        if story_result.returncode == 0 and story_result.stdout:
-                            story = json.loads(story_result.stdout)
-                            title = story.get('title', '')
-                            if title and any(kw in title.lower() for kw in keywords):
-                                news_items.append(("Hacker News", title))
-                                if len(news_items) >= 5:
-                                    break
-                    except:
-                        continue
-        except:
-            pass
+        hn = HNClient(timeout=3)
+
+        def is_relevant(story):
+            title = story.get('title', '')
+            if story.get('time', since) < since:
+                return False
+            return matcher.search(title) and not dedupe.is_duplicate(title)
+
+        for story in hn.find_stories(hn.top_stories()[:5], is_relevant, limit=5):
+            news_items.append(("Hacker News", story['title']))
+
+    dedupe.save()
 
     # Return news or helpful error message
     if news_items:
@@ -366,27 +277,15 @@ def format_news(news_items):
     return "\n".join(lines)
 
 def get_reminders():
-    """Get today's reminders from Apple Reminders"""
+    """Get today's reminders from the local mirror (Apple Reminders via remindctl, JSON sources)"""
     try:
-        result = subprocess.run(
-            ["remindctl", "list", "--today", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=8
-        )
-        if result.returncode == 0 and result.stdout:
-            reminders = json.loads(result.stdout)
-            if reminders:
-                return reminders
-    except subprocess.TimeoutExpired:
-        return None  # Timeout is handled gracefully
-    except json.JSONDecodeError:
-        return None  # Invalid JSON, handle gracefully
-    except FileNotFoundError:
-        return None  # remindctl not installed, that's OK
+        import calendar_store
+
+        store = calendar_store.get_store()
+        store.sync(calendar_store.default_adapters(config), kind="reminder")
+        return store.today_reminders() or None
     except Exception:
-        return None  # Any other error, fail silently
-    return None
+        return None  # Any error, fail silently
 
 def format_reminders(reminders):
     """Format reminders for display"""
@@ -401,10 +300,10 @@ def format_reminders(reminders):
 
 def get_daily_note():
     """Get or create today's planning note"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    note_path = NOTES_DIR / f"{today}.md"
+    today = timeservice.today().isoformat()
+    note_path = os.path.join(NOTES_DIR, f"{today}.md")
 
-    if not note_path.exists():
+    if not os.path.exists(note_path):
         template = f"""# Day Plan - {today}
 
 ## 🎯 Top 3 Priorities
@@ -416,7 +315,8 @@ def get_daily_note():
 
 ## 💡 One Thing to Remember
 """
-        note_path.write_text(template)
+        with open(note_path, "w") as f:
+            f.write(template)
 
     return note_path
 
@@ -430,52 +330,98 @@ def display_menu(note_path):
 
 def get_stock_prices():
     """Get stock prices for major tech/TMT companies"""
-    stock_script = Path.home() / ".openclaw" / "workspace" / "stock_prices.py"
+    from response_cache import cached_fetch
 
-    if not stock_script.exists():
+    try:
+        # In-process - no interpreter spawn or stdout scraping
+        import stock_prices
+    except ImportError:
         return None
 
-    try:
-        result = subprocess.run(
-            ["python3", str(stock_script)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    def fetch():
+        quotes = stock_prices.fetch_quotes()
+        if not any(quote.ok for quote in quotes):
+            return None
+        return [quote._asdict() for quote in quotes]
 
-        if result.returncode == 0 and result.stdout:
-            return result.stdout
+    try:
+        quotes = cached_fetch("prices", "quotes", fetch)
     except Exception as e:
-        pass
+        return None
 
+    if quotes:
+        return stock_prices.format_quotes([stock_prices.Quote(**quote) for quote in quotes])
     return None
 
 def get_sydney_time():
-    """Get current time in Sydney"""
-    try:
-        # Using date command to get Sydney time
-        result = subprocess.run(
-            ["TZ='Australia/Sydney'", "date", "+%Y-%m-%d %H:%M"],
-            capture_output=True,
-            text=True,
-            shell=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout:
-            dt_str = result.stdout.strip()
-            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-            return dt.strftime("%A, %B %d, %Y")
-    except:
-        pass
-    return datetime.now().strftime("%A, %B %d, %Y")
+    """Today's date in the user's time zone (config TIMEZONE, Sydney by default)"""
+    return timeservice.now().strftime("%A, %B %d, %Y")
 
-def main():
-    import sys
+def render_weather(weather):
+    """Render the weather line"""
+    return f"\n🌤️  {weather or 'Weather unavailable'}"
+
+def render_calendar(events):
+    """Render the calendar section"""
+    if events:
+        return format_calendar(events)
+    return "\n📅 Today's Calendar:\n  No events today"
 
+def render_reminders(reminders):
+    """Render the reminders section"""
+    if reminders:
+        return format_reminders(reminders)
+    return "\n📋 No reminders for today"
+
+def render_news(news):
+    """Render the news section"""
+    if news:
+        return format_news(news)
+    return "\n📰 Overnight News:\n  Unable to fetch news"
+
+def render_stocks(stocks):
+    """Render the stock prices section"""
+    if stocks:
+        return stocks
+    return "\n💹 Stock Prices:\n  Unable to fetch"
+
+def snapshot_worthy(name, value):
+    """Keep failure placeholders out of the snapshot so they're retried live"""
+    if name == "weather":
+        return not value.startswith("Weather unavailable")
+    if name == "news":
+        return not (len(value) == 1 and value[0][0] == "Note")
+    return True
+
+def morning_sections(include_stocks=False):
+    """(name, title, fetch, render) for each section of the morning screen"""
+    sections = [
+        ("weather", "🌤️  Weather", get_weather, render_weather),
+        ("calendar", "📅 Today's Calendar", get_calendar_events, render_calendar),
+        ("reminders", "📋 Today's Reminders", get_reminders, render_reminders),
+        ("news", "📰 Overnight News", get_overnight_news, render_news),
+    ]
+    if include_stocks:
+        sections.append(("stocks", "💹 Stock Prices", get_stock_prices, render_stocks))
+    return sections
+
+def main():
     ensure_dirs()
 
+    # Background modes: build the morning snapshot ahead of time
+    if "--prefetch" in sys.argv:
+        ready = prefetch(morning_sections(include_stocks=True), keep=snapshot_worthy)
+        print(f"✓ Snapshot updated: {', '.join(ready) or 'nothing fetched'}")
+        return
+    if "--serve" in sys.argv:
+        interval = getattr(config, 'SNAPSHOT_INTERVAL', SERVE_INTERVAL)
+        print(f"🔄 Refreshing the day-starter snapshot every {interval // 60} min (Ctrl-C to stop)")
+        serve(morning_sections(include_stocks=True), interval, keep=snapshot_worthy)
+        return
+
     # Check for non-interactive mode
     non_interactive = "--non-interactive" in sys.argv
+    cached_only = "--cached" in sys.argv
 
     # Header
     print("=" * 50)
@@ -484,37 +430,22 @@ def main():
     print(f"📅 {today}")
     print("=" * 50)
 
-    # Weather
-    weather = get_weather()
-    print(f"\n🌤️  {weather}")
-
-    # Calendar
-    events = get_calendar_events()
-    if events:
-        print(format_calendar(events))
+    if cached_only:
+        # Fast start: draw today's prefetched snapshot as-is, fetch nothing
+        snapshot = load_today()
+        render_snapshot(morning_sections(include_stocks="stocks" in snapshot), snapshot)
     else:
-        print("\n📅 Today's Calendar:\n  No events today")
-
-    # Reminders
-    reminders = get_reminders()
-    if reminders:
-        print(format_reminders(reminders))
-    else:
-        print("\n📋 No reminders for today")
-
-    # News
-    news = get_overnight_news()
-    if news:
-        print(format_news(news))
-    else:
-        print("\n📰 Overnight News:\n  Unable to fetch news")
-
-    # Stock Prices (skip - takes too long)
-    #stocks = get_stock_prices()
-    #if stocks:
-    #    print(stocks)
-    #else:
-    #    print("\n💹 Stock Prices:\n  Unable to fetch")
+        from fetch_scheduler import DEFAULT_DEADLINE, run_sections
+
+        # Fresh sections come straight from the prefetched snapshot; the rest are
+        # fetched at once and each prints as soon as it's ready
+        snapshot = load_fresh()
+        deadline = getattr(config, 'FETCH_DEADLINE', DEFAULT_DEADLINE)
+        # Stock prices take too long to fetch live - only shown when prefetched
+        values = run_sections(morning_sections(include_stocks="stocks" in snapshot),
+                              deadline=deadline, cached=snapshot)
+        save_snapshot({name: value for name, value in values.items() if name not in snapshot},
+                      keep=snapshot_worthy)
 
     # Daily note
     note_path = get_daily_note()
@@ -530,13 +461,14 @@ def main():
                     print("Have a great day! 🚀")
                     break
                 elif choice == "o":
-                    subprocess.run(["open", "-a", "TextEdit", str(note_path)])
+                    import subprocess
+                    subprocess.run(["open", "-a", "TextEdit", note_path])
                     break
                 elif choice == "n":
                     note = input("Quick note: ").strip()
                     if note:
-                        with open(note_path, "a") as f:
-                            f.write(f"\n- {note}")
+                        from note_journal import capture
+                        capture(note, compact=True)
                         print("✓ Note saved")
                         display_menu(note_path)
                     else:
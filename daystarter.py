@@ -4,12 +4,14 @@ Day Starter CLI - Your daily command center
 Shows weather, calendar, reminders, and overnight news
 """
 
-import json
 import os
-import subprocess
 import sys
-from datetime import datetime
-from pathlib import Path
+
+# Everything else is imported by the sections that use it, so rendering the
+# prefetched snapshot (--cached) doesn't pay for network, SQLite or threads
+import timeservice
+from snapshot_store import (SERVE_INTERVAL, load_fresh, load_today, prefetch, render_snapshot,
+                            save_snapshot, serve)
 
 # Import config
 try:
@@ -30,79 +32,41 @@ except ImportError:
         ]
     config = Config()
 
+# One clock for every section: the header, calendar day, notes and news window
+timeservice.set_timezone(getattr(config, 'TIMEZONE', timeservice.DEFAULT_TIMEZONE))
+
 # Config paths
-CONFIG_DIR = Path.home() / ".config" / "daystarter"
-NOTES_DIR = Path.home() / "Documents" / "DayStarters"
+CONFIG_DIR = os.path.expanduser("~/.config/daystarter")
+NOTES_DIR = os.path.expanduser("~/Documents/DayStarters")
 
 def ensure_dirs():
     """Create necessary directories"""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    NOTES_DIR.mkdir(parents=True, exist_ok=True)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    os.makedirs(NOTES_DIR, exist_ok=True)
 
 def get_weather():
     """Get weather from wttr.in (no API key needed)"""
+    from response_cache import cached_text
+
     try:
-        # Use curl for compatibility - specify Sydney
-        result = subprocess.run(
-            ["curl", "-s", "wttr.in/Sydney?format=%l:+%c+%t+%w"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout:
-            return result.stdout.strip()
+        # Specify Sydney
+        weather = cached_text("weather", "https://wttr.in/Sydney?format=%l:+%c+%t+%w", timeout=5)
+        if weather:
+            return weather.strip()
     except:
         pass
     return "Weather unavailable"
 
 def get_calendar_events():
-    """Get today's calendar events from macOS Calendar (works with Google Calendar)"""
+    """Get today's calendar events from the local mirror (macOS Calendar, ICS and JSON sources)"""
     try:
-        # Use AppleScript to query all calendars
-        script = """
-        tell application "Calendar"
-            set todayDate to current date
-            set time of todayDate to 0
-            set tomorrowDate to todayDate + (1 * days)
-
-            set eventList to ""
-
-            repeat with cal in every calendar
-                try
-                    set calEvents to every event of cal whose start date ≥ todayDate and start date < tomorrowDate
-                    repeat with currentEvent in calEvents
-                        set eventTitle to summary of currentEvent
-                        set eventStart to start date of currentEvent
-                        set eventTime to time string of eventStart
-                        set eventList to eventList & eventTime & "\t" & eventTitle & "\n"
-                    end repeat
-                end try
-            end repeat
-
-            return eventList
-        end tell
-        """
-
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if result.returncode == 0 and result.stdout.strip():
-            events = []
-            for line in result.stdout.strip().split('\n'):
-                if '\t' in line:
-                    parts = line.split('\t')
-                    if len(parts) >= 2:
-                        time = parts[0]
-                        event = parts[1]
-                        events.append((time, event))
-            return events
-    except Exception as e:
-        pass
-    return None
+        import calendar_store
+
+        store = calendar_store.get_store()
+        store.sync(calendar_store.default_adapters(config), kind="event")
+        return store.today_events() or None
+    except Exception:
+        return None  # Silent failure - let caller handle display
 
 def format_calendar(events):
     """Format calendar events for display"""
@@ -114,8 +78,14 @@ def format_calendar(events):
             lines.append(f"  🕐 {time} - {event}")
     return "\n".join(lines)
 
-def get_newsapi_news():
-    """Fetch news from NewsAPI.org"""
+def get_newsapi_news(dedupe=None, since=None):
+    """
+    Fetch news from NewsAPI.org (skipping headlines in the dedupe index, and
+    articles published before `since` epoch seconds, if given)
+    """
+    from keyword_matcher import matcher_for
+    from response_cache import cached_json
+
     news_items = []
 
     if not hasattr(config, 'NEWS_API_KEY') or not config.NEWS_API_KEY:
@@ -123,32 +93,30 @@ def get_newsapi_news():
 
     categories = getattr(config, 'NEWS_CATEGORIES', ['business', 'technology'])
     max_articles = getattr(config, 'MAX_ARTICLES', 10)
-    keywords = getattr(config, 'FINANCE_KEYWORDS', [])
+    matcher = matcher_for(getattr(config, 'FINANCE_KEYWORDS', []))
 
     for category in categories:
         try:
             url = f"https://newsapi.org/v2/top-headlines?category={category}&language=en&apiKey={config.NEWS_API_KEY}"
-            result = subprocess.run(
-                ["curl", "-s", "--max-time", "10", url],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-
-            if result.returncode == 0 and result.stdout:
-                data = json.loads(result.stdout)
+            data = cached_json("news", url, timeout=10)
 
+            if data:
                 if data.get("status") == "ok" and "articles" in data:
                     for article in data["articles"]:
                         title = article.get("title", "")
                         source = article.get("source", {}).get("name", "News")
                         description = article.get("description", "")
+                        published = timeservice.parse_timestamp(article.get("publishedAt"))
+                        if since and published and published < since:
+                            continue
 
                         # Combine title and description for better filtering
-                        full_text = f"{title} {description}".lower()
+                        full_text = f"{title} {description}"
 
                         # Filter for finance/tech/telco content
-                        if title and any(kw.lower() in full_text for kw in keywords):
+                        if title and matcher.search(full_text):
+                            if dedupe and dedupe.is_duplicate(title):
+                                continue
                             news_items.append((source, title))
                             if len(news_items) >= max_articles:
                                 break
@@ -161,90 +129,69 @@ def get_newsapi_news():
 
 def get_overnight_news():
     """Get overnight finance/tech/telco news from various sources"""
+    from dedupe_index import DedupeIndex
+    from hn_client import HNClient
+    from keyword_matcher import matcher_for
+
+    # Near-duplicate headline index, shared across runs
+    dedupe = DedupeIndex()
+    # Only what was published since the ASX close - the UK and US sessions
+    since = timeservice.overnight_window()[0].timestamp()
 
     # Primary: Try NewsAPI first (more comprehensive financial news)
-    newsapi_news = get_newsapi_news()
+    newsapi_news = get_newsapi_news(dedupe, since)
     if newsapi_news:
+        dedupe.save()
         return newsapi_news
 
     # Fallback: Get business/finance stories from Hacker News
     news_items = []
-
-    try:
-        result = subprocess.run(
-            ["curl", "-s", "--max-time", "5", "https://hacker-news.firebaseio.com/v0/topstories.json"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        if result.returncode == 0 and result.stdout:
-            story_ids = json.loads(result.stdout)[:50]
-            for story_id in story_ids:
-                story_result = subprocess.run(
-                    ["curl", "-s", "--max-time", "3", f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if story_result.returncode == 0 and story_result.stdout:
-                    story = json.loads(story_result.stdout)
-                    title = story.get("title", "")
-
-                    # Filter for finance/business-related tech content
-                    biz_keywords = [
-                        # Market/Trading
-                        "earnings", "stock", "share", "price", "market", "nasdaq", "dow", "ipo", "trading",
-                        # Investment
-                        "investment", "investor", "funding", "venture", "startup", "acquisition", "merger",
-                        "buyback", "dividend", "portfolio", "fund",
-                        # Company financials
-                        "revenue", "profit", "loss", "quarterly", "annual", "report",
-                        # Big tech
-                        "apple", "google", "microsoft", "amazon", "meta", "tesla", "nvidia", "intel", "amd",
-                        # Telecom
-                        "telecom", "telco", "5g", "verizon", "at&t", "vodafone", "bt",
-                        # Media
-                        "disney", "netflix", "warner", "paramount", "comcast",
-                        # Financial events
-                        "wall street", "premarket", "after hours", "sec filing"
-                    ]
-                    if title and any(kw.lower() in title.lower() for kw in biz_keywords):
-                        news_items.append(("Market News", title))
-                        if len(news_items) >= 8:
-                            break
-    except Exception as e:
-        pass
+    hn = HNClient()
+    story_ids = hn.top_stories()
+
+    # Filter for finance/business-related tech content
+    biz_keywords = [
+        # Market/Trading
+        "earnings", "stock", "share", "price", "market", "nasdaq", "dow", "ipo", "trading",
+        # Investment
+        "investment", "investor", "funding", "venture", "startup", "acquisition", "merger",
+        "buyback", "dividend", "portfolio", "fund",
+        # Company financials
+        "revenue", "profit", "loss", "quarterly", "annual", "report",
+        # Big tech
+        "apple", "google", "microsoft", "amazon", "meta", "tesla", "nvidia", "intel", "amd",
+        # Telecom
+        "telecom", "telco", "5g", "verizon", "at&t", "vodafone", "bt",
+        # Media
+        "disney", "netflix", "warner", "paramount", "comcast",
+        # Financial events
+        "wall street", "premarket", "after hours", "sec filing"
+    ]
+
+    biz_matcher = matcher_for(biz_keywords)
+
+    def is_business(story):
+        title = story.get("title", "")
+        if story.get("time", since) < since:
+            return False
+        return biz_matcher.search(title) and not dedupe.is_duplicate(title)
+
+    for story in hn.find_stories(story_ids[:50], is_business, limit=8):
+        news_items.append(("Market News", story["title"]))
 
     # Fallback: Get general tech news if not enough financial news
+    # (reuses the same top stories list and already-fetched items)
     if len(news_items) < 4:
-        try:
-            result = subprocess.run(
-                ["curl", "-s", "--max-time", "5", "https://hacker-news.firebaseio.com/v0/topstories.json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout:
-                story_ids = json.loads(result.stdout)[:30]
-                for story_id in story_ids:
-                    story_result = subprocess.run(
-                        ["curl", "-s", "--max-time", "3", f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if story_result.returncode == 0 and story_result.stdout:
-                        story = json.loads(story_result.stdout)
-                        title = story.get("title", "")
-                        # Avoid duplicates
-                        if title and not any(title == item[1] for item in news_items):
-                            news_items.append(("Hacker News", title))
-                            if len(news_items) >= 8:
-                                break
-        except Exception as e:
-            pass
+        def is_new(story):
+            title = story.get("title", "")
+            if story.get("time", since) < since:
+                return False
+            return title and not dedupe.is_duplicate(title)
+
+        for story in hn.find_stories(story_ids[:30], is_new, limit=8 - len(news_items)):
+            news_items.append(("Hacker News", story["title"]))
+
+    dedupe.save()
 
     # Return news if we have any
     if news_items:
@@ -264,21 +211,15 @@ def format_news(news_items):
     return "\n".join(lines)
 
 def get_reminders():
-    """Get today's reminders from Apple Reminders"""
+    """Get today's reminders from the local mirror (Apple Reminders via remindctl, JSON sources)"""
     try:
-        result = subprocess.run(
-            ["remindctl", "list", "--today", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout:
-            reminders = json.loads(result.stdout)
-            if reminders:
-                return reminders
-    except:
-        pass
-    return None
+        import calendar_store
+
+        store = calendar_store.get_store()
+        store.sync(calendar_store.default_adapters(config), kind="reminder")
+        return store.today_reminders() or None
+    except Exception:
+        return None  # Any error, fail silently
 
 def format_reminders(reminders):
     """Format reminders for display"""
@@ -293,10 +234,10 @@ def format_reminders(reminders):
 
 def get_daily_note():
     """Get or create today's planning note"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    note_path = NOTES_DIR / f"{today}.md"
+    today = timeservice.today().isoformat()
+    note_path = os.path.join(NOTES_DIR, f"{today}.md")
 
-    if not note_path.exists():
+    if not os.path.exists(note_path):
         template = f"""# Day Plan - {today}
 
 ## 🎯 Top 3 Priorities
@@ -308,7 +249,8 @@ def get_daily_note():
 
 ## 💡 One Thing to Remember
 """
-        note_path.write_text(template)
+        with open(note_path, "w") as f:
+            f.write(template)
 
     return note_path
 
@@ -322,48 +264,93 @@ def display_menu(note_path):
 
 def get_stock_prices():
     """Get stock prices for major tech/TMT companies"""
-    stock_script = Path.home() / ".openclaw" / "workspace" / "stock_prices.py"
+    from response_cache import cached_fetch
 
-    if not stock_script.exists():
+    try:
+        # In-process - no interpreter spawn or stdout scraping
+        import stock_prices
+    except ImportError:
         return None
 
+    def fetch():
+        quotes = stock_prices.fetch_quotes()
+        if not any(quote.ok for quote in quotes):
+            return None
+        return [quote._asdict() for quote in quotes]
+
     try:
-        result = subprocess.run(
-            ["python3", str(stock_script)],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode == 0 and result.stdout:
-            return result.stdout
+        quotes = cached_fetch("prices", "quotes", fetch)
     except Exception as e:
-        pass
+        return None
 
+    if quotes:
+        return stock_prices.format_quotes([stock_prices.Quote(**quote) for quote in quotes])
     return None
 
 def get_sydney_time():
-    """Get current time in Sydney"""
-    try:
-        # Using date command to get Sydney time
-        result = subprocess.run(
-            ["TZ='Australia/Sydney'", "date", "+%Y-%m-%d %H:%M"],
-            capture_output=True,
-            text=True,
-            shell=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout:
-            dt_str = result.stdout.strip()
-            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-            return dt.strftime("%A, %B %d, %Y")
-    except:
-        pass
-    return datetime.now().strftime("%A, %B %d, %Y")
+    """Today's date in the user's time zone (config TIMEZONE, Sydney by default)"""
+    return timeservice.now().strftime("%A, %B %d, %Y")
+
+def render_weather(weather):
+    """Render the weather line"""
+    return f"\n🌤️  {weather or 'Weather unavailable'}"
+
+def render_calendar(events):
+    """Render the calendar section"""
+    if events:
+        return format_calendar(events)
+    return "\n📅 Today's Calendar:\n  No events today"
+
+def render_reminders(reminders):
+    """Render the reminders section"""
+    if reminders:
+        return format_reminders(reminders)
+    return "\n📋 No reminders for today"
+
+def render_news(news):
+    """Render the news section"""
+    if news:
+        return format_news(news)
+    return "\n📰 Overnight News:\n  Unable to fetch news"
+
+def render_stocks(stocks):
+    """Render the stock prices section"""
+    if stocks:
+        return stocks
+    return "\n💹 Stock Prices:\n  Unable to fetch"
+
+def snapshot_worthy(name, value):
+    """Keep failure placeholders out of the snapshot so they're retried live"""
+    if name == "weather":
+        return not value.startswith("Weather unavailable")
+    if name == "news":
+        return not (len(value) == 1 and value[0][0] == "Note")
+    return True
+
+def morning_sections():
+    """(name, title, fetch, render) for each section of the morning screen"""
+    return [
+        ("weather", "🌤️  Weather", get_weather, render_weather),
+        ("calendar", "📅 Today's Calendar", get_calendar_events, render_calendar),
+        ("reminders", "📋 Today's Reminders", get_reminders, render_reminders),
+        ("news", "📰 Overnight News", get_overnight_news, render_news),
+        ("stocks", "💹 Stock Prices", get_stock_prices, render_stocks),
+    ]
 
 def main():
     ensure_dirs()
 
+    # Background modes: build the morning snapshot ahead of time
+    if "--prefetch" in sys.argv:
+        ready = prefetch(morning_sections(), keep=snapshot_worthy)
+        print(f"✓ Snapshot updated: {', '.join(ready) or 'nothing fetched'}")
+        return
+    if "--serve" in sys.argv:
+        interval = getattr(config, 'SNAPSHOT_INTERVAL', SERVE_INTERVAL)
+        print(f"🔄 Refreshing the day-starter snapshot every {interval // 60} min (Ctrl-C to stop)")
+        serve(morning_sections(), interval, keep=snapshot_worthy)
+        return
+
     # Header
     print("=" * 50)
     today = get_sydney_time()
@@ -371,37 +358,19 @@ def main():
     print(f"📅 {today}")
     print("=" * 50)
 
-    # Weather
-    weather = get_weather()
-    print(f"\n🌤️  {weather}")
-
-    # Calendar
-    events = get_calendar_events()
-    if events:
-        print(format_calendar(events))
-    else:
-        print("\n📅 Today's Calendar:\n  No events today")
-
-    # Reminders
-    reminders = get_reminders()
-    if reminders:
-        print(format_reminders(reminders))
-    else:
-        print("\n📋 No reminders for today")
-
-    # News
-    news = get_overnight_news()
-    if news:
-        print(format_news(news))
+    if "--cached" in sys.argv:
+        # Fast start: draw today's prefetched snapshot as-is, fetch nothing
+        render_snapshot(morning_sections(), load_today())
     else:
-        print("\n📰 Overnight News:\n  Unable to fetch news")
+        from fetch_scheduler import DEFAULT_DEADLINE, run_sections
 
-    # Stock Prices
-    stocks = get_stock_prices()
-    if stocks:
-        print(stocks)
-    else:
-        print("\n💹 Stock Prices:\n  Unable to fetch")
+        # Fresh sections come straight from the prefetched snapshot; the rest are
+        # fetched at once and each prints as soon as it's ready
+        snapshot = load_fresh()
+        deadline = getattr(config, 'FETCH_DEADLINE', DEFAULT_DEADLINE)
+        values = run_sections(morning_sections(), deadline=deadline, cached=snapshot)
+        save_snapshot({name: value for name, value in values.items() if name not in snapshot},
+                      keep=snapshot_worthy)
 
     # Daily note
     note_path = get_daily_note()
@@ -416,13 +385,14 @@ def main():
                 print("Have a great day! 🚀")
                 break
             elif choice == "o":
-                subprocess.run(["open", "-a", "TextEdit", str(note_path)])
+                import subprocess
+                subprocess.run(["open", "-a", "TextEdit", note_path])
                 break
             elif choice == "n":
                 note = input("Quick note: ").strip()
                 if note:
-                    with open(note_path, "a") as f:
-                        f.write(f"\n- {note}")
+                    from note_journal import capture
+                    capture(note, compact=True)
                     print("✓ Note saved")
                     display_menu(note_path)
                 else:
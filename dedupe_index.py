@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Dedupe Index - Near-duplicate headline detection for news
+Normalised-title hashes catch exact repeats, 64-bit SimHash signatures
+bucketed by band catch the same story syndicated with different wording.
+Persists across runs so yesterday's headlines don't come back as "overnight"
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+INDEX_FILE = Path.home() / ".config" / "daystarter" / "seen_headlines.json"
+
+# Forget headlines after this long
+RETENTION = 3 * 24 * 60 * 60
+# A headline first seen longer ago than this counts as already shown
+REPEAT_AFTER = 12 * 60 * 60
+
+SIMHASH_BITS = 64
+BANDS = 4  # 4 x 16-bit bands: any signature within 3 bits shares a band
+BAND_BITS = SIMHASH_BITS // BANDS
+MAX_DISTANCE = 3
+
+# " - Reuters", " | CNBC" style publisher suffixes
+SOURCE_SUFFIX = re.compile(r"\s+[-|–—:]\s+[^-|–—:]{2,30}$")
+NON_WORD = re.compile(r"[^\w\s]+")
+
+STOPWORDS = frozenset(
+    "a an the and or of to in on for at by with from as is are was be its it "
+    "this that after over into says said".split()
+)
+
+def normalise_title(title):
+    """Lowercase, drop publisher suffix and punctuation, collapse whitespace"""
+    title = SOURCE_SUFFIX.sub("", title.strip())
+    title = NON_WORD.sub(" ", title.lower())
+    return " ".join(title.split())
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+def simhash(normalised):
+    """64-bit SimHash over words and word pairs (stopwords dropped)"""
+    words = [w for w in normalised.split() if w not in STOPWORDS] or normalised.split()
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    if not features:
+        return 0
+
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        h = _hash64(feature)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+def _bands(signature):
+    mask = (1 << BAND_BITS) - 1
+    return [(band, signature >> (band * BAND_BITS) & mask) for band in range(BANDS)]
+
+class DedupeIndex:
+    """Persistent index of recently seen headlines"""
+
+    def __init__(self, path=INDEX_FILE, retention=RETENTION, repeat_after=REPEAT_AFTER):
+        self.path = Path(path) if path else None
+        self.lock_path = self.path.with_name(self.path.name + ".lock") if path else None
+        self.retention = retention
+        self.repeat_after = repeat_after
+        self._entries = {}   # exact hash -> [simhash, first_seen]
+        self._buckets = {}   # (band, value) -> set of exact hashes
+        self._this_run = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        for key, (signature, first_seen) in self._read_entries().items():
+            self._insert(key, signature, first_seen)
+
+    def _read_entries(self):
+        """Unexpired {key: [simhash, first_seen]} on disk - malformed entries are dropped"""
+        try:
+            entries = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        cutoff = time.time() - self.retention
+        valid = {}
+        for key, entry in entries.items():
+            try:
+                signature, first_seen = entry
+                if not isinstance(signature, int) or not isinstance(first_seen, (int, float)):
+                    continue
+            except (TypeError, ValueError):
+                continue
+            if first_seen >= cutoff:
+                valid[key] = [signature, first_seen]
+        return valid
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock held across a save's read-merge-write in every process"""
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _insert(self, key, signature, first_seen):
+        self._entries[key] = [signature, first_seen]
+        for band in _bands(signature):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def _find(self, key, signature):
+        """Exact match first, then any near match sharing a band"""
+        if key in self._entries:
+            return key
+        for band in _bands(signature):
+            for candidate in self._buckets.get(band, ()):
+                if bin(self._entries[candidate][0] ^ signature).count("1") <= MAX_DISTANCE:
+                    return candidate
+        return None
+
+    def is_duplicate(self, title, now=None):
+        """
+        True if this headline (or a near copy) was already used in this run,
+        or was first seen long enough ago to count as old news. Otherwise the
+        headline is recorded and False is returned.
+        """
+        now = now or time.time()
+        normalised = normalise_title(title)
+        if not normalised:
+            return True
+        key = hashlib.sha1(normalised.encode()).hexdigest()[:16]
+        signature = simhash(normalised)
+
+        with self._lock:
+            match = self._find(key, signature)
+            if match is None:
+                self._insert(key, signature, now)
+                self._this_run.add(key)
+                return False
+            if match in self._this_run:
+                return True
+            if now - self._entries[match][1] > self.repeat_after:
+                return True
+            # Seen earlier this morning - fine to show again on a re-run
+            self._this_run.add(match)
+            return False
+
+    def save(self):
+        """
+        Write the index back to disk (atomic replace). Headlines another run
+        saved since we loaded are merged in first, keeping the earliest
+        first-seen time, so concurrent runs don't drop each other's entries
+        """
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._locked():
+                with self._lock:
+                    for key, (signature, first_seen) in self._read_entries().items():
+                        current = self._entries.get(key)
+                        if current is None:
+                            self._insert(key, signature, first_seen)
+                        elif first_seen < current[1]:
+                            current[1] = first_seen
+                    data = json.dumps(self._entries)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+        except OSError:
+            pass
@@ -7,6 +7,12 @@ Fetches and summarizes news for ASX coverage stocks
 import json
 import sys
 from datetime import datetime, timedelta
+from pathlib import Path
+
+# Shared workspace modules live one level up
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from keyword_matcher import matcher_for
 
 # Load tickers
 def load_tickers():
@@ -25,25 +31,27 @@ def search_news(ticker, company):
     return []
 
 # Filter significant news
-def is_significant(news_item):
+# Significant: earnings, M&A, guidance changes, management changes, regulatory issues
+SIGNIFICANT_KEYWORDS = [
+    'earnings', 'profit', 'loss', 'revenue', 'result',
+    'acquisition', 'merger', 'takeover', 'buyout',
+    'guidance', 'outlook', 'forecast', 'upgrade', 'downgrade',
+    'ceo', 'chief executive', 'director', 'management',
+    'regulatory', 'asic', 'investigation', 'fine',
+    'capital raising', 'placement', 'rights issue',
+    'suspension', 'trading halt'
+]
+
+def is_significant(news_item, extra_keywords=()):
     """
     Determine if news is significant enough to alert.
-    Significant: earnings, M&A, guidance changes, management changes, regulatory issues
+    extra_keywords (e.g. coverage tickers) are matched alongside the
+    standard list; the compiled matcher is cached per keyword set.
     """
-    significant_keywords = [
-        'earnings', 'profit', 'loss', 'revenue', 'result',
-        'acquisition', 'merger', 'takeover', 'buyout',
-        'guidance', 'outlook', 'forecast', 'upgrade', 'downgrade',
-        'ceo', 'chief executive', 'director', 'management',
-        'regulatory', 'asic', 'investigation', 'fine',
-        'capital raising', 'placement', 'rights issue',
-        'suspension', 'trading halt'
-    ]
-
+    matcher = matcher_for(tuple(SIGNIFICANT_KEYWORDS) + tuple(extra_keywords))
     text = news_item.get('title', '') + ' ' + news_item.get('snippet', '')
-    text = text.lower()
 
-    return any(keyword in text for keyword in significant_keywords)
+    return matcher.search(text)
 
 # Format briefing
 def format_briefing(all_news):
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Feed Parser - Streaming RSS 2.0 / Atom parser
+Yields items as bytes arrive so callers can stop reading after a few titles
+"""
+
+import html
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from itertools import islice
+
+from timeservice import parse_timestamp
+
+# timestamp: epoch seconds parsed from pubDate/published/updated (None if undated)
+FeedRecord = namedtuple("FeedRecord", ["source", "title", "link", "published", "timestamp"],
+                        defaults=(None,))
+
+ITEM_TAGS = ("item", "entry")
+# Older-than-window items in a row before a (newest-first) feed is abandoned
+STALE_RUN = 3
+
+def _local(tag):
+    """Strip the XML namespace from a tag name"""
+    return tag.rsplit("}", 1)[-1]
+
+def clean_text(text):
+    """Trim, drop stray CDATA markers and decode (possibly double-escaped) entities"""
+    if not text:
+        return ""
+    text = text.replace("<![CDATA[", "").replace("]]>", "")
+    for _ in range(2):
+        if "&" not in text:
+            break
+        text = html.unescape(text)
+    return text.strip()
+
+def _record(source, item):
+    """Build a FeedRecord from a finished <item> or <entry> element"""
+    title = link = published = updated = ""
+
+    for child in item:
+        name = _local(child.tag)
+        if name == "title":
+            title = clean_text("".join(child.itertext()))
+        elif name == "link":
+            # RSS puts the URL in the text, Atom in href (prefer rel="alternate")
+            href = child.get("href")
+            if href:
+                if not link or child.get("rel", "alternate") == "alternate":
+                    link = href.strip()
+            elif child.text:
+                link = child.text.strip()
+        elif name in ("pubDate", "published", "date"):
+            published = (child.text or "").strip()
+        elif name == "updated":
+            updated = (child.text or "").strip()
+
+    if not title:
+        return None
+    published = published or updated
+    return FeedRecord(source, title, link, published, parse_timestamp(published))
+
+def iter_records(source, chunks):
+    """
+    Incrementally parse an RSS/Atom document from an iterable of byte chunks,
+    yielding FeedRecords as each item completes. Closing the generator stops
+    reading from chunks.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    found = False
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if _local(elem.tag) in ITEM_TAGS:
+                    record = _record(source, elem)
+                    elem.clear()  # keep memory flat on large feeds
+                    if record:
+                        found = True
+                        yield record
+        parser.close()
+        for _, elem in parser.read_events():
+            if _local(elem.tag) in ITEM_TAGS:
+                record = _record(source, elem)
+                if record:
+                    yield record
+    except ET.ParseError:
+        # Trailing garbage after good items is common - keep what we got
+        if not found:
+            raise
+
+def within_window(records, since, stale_run=STALE_RUN):
+    """
+    Drop records published before `since` (epoch seconds), and stop once
+    `stale_run` of them arrive in a row - feeds are newest-first, so the rest
+    of the document is older still. Undated records are kept. A feed whose
+    first dated record is already older may be oldest-first, so it is read
+    to the end instead.
+    """
+    older = 0
+    newest_first = None
+    for record in records:
+        if record.timestamp is not None and record.timestamp < since:
+            if newest_first is None:
+                newest_first = False
+            older += 1
+            if newest_first and older >= stale_run:
+                return
+            continue
+        if record.timestamp is not None and newest_first is None:
+            newest_first = True
+        older = 0
+        yield record
+
+def _collect(records, read):
+    for record in records:
+        read.append(record)
+        yield record
+
+def parse_feed(source, chunks, limit=None, since=None, read=None):
+    """
+    Return up to `limit` records (published since `since`, if given), reading
+    only as much input as needed. If `read` is a list, every record parsed is
+    appended to it - including older ones the window skipped
+    """
+    records = iter_records(source, chunks)
+    parsed = records if read is None else _collect(records, read)
+    wanted = parsed if since is None else within_window(parsed, since)
+    try:
+        return list(islice(wanted, limit))
+    finally:
+        records.close()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Section Fetch Scheduler - Run day-starter sections concurrently
+Starts every section at once and renders each one as soon as its data arrives
+"""
+
+import queue
+import threading
+import time
+
+# Global budget for the whole morning screen (seconds)
+DEFAULT_DEADLINE = 20
+
+def _run_section(name, fetch, results):
+    """Run one section fetcher and report its result (None on failure)"""
+    try:
+        value = fetch()
+    except Exception:
+        value = None
+    results.put((name, value))
+
+def placeholder(title, deadline):
+    """Text shown for a section that missed the deadline"""
+    return f"\n{title}:\n  ⏳ Still pending (timed out after {deadline}s)"
+
+def run_sections(sections, deadline=DEFAULT_DEADLINE, emit=print, cached=None):
+    """
+    Fetch all sections at once, bounded by a single global deadline.
+
+    sections: list of (name, title, fetch, render) tuples. fetch() takes no
+    arguments; render(value) returns the text for the section.
+    cached: optional dict of name -> value already known (e.g. a prefetched
+    snapshot); those sections render immediately and aren't fetched.
+    Sections are emitted in the order they finish. Anything still running
+    when the deadline passes gets a placeholder instead of blocking the rest.
+    Returns a dict of name -> value (missing for late sections).
+    """
+    results = queue.Queue()
+    pending = {}
+    cached = cached or {}
+
+    for name, title, fetch, render in sections:
+        pending[name] = (title, render)
+        if name in cached:
+            results.put((name, cached[name]))
+            continue
+        # Daemon threads so a hung fetcher can't keep the CLI alive
+        threading.Thread(
+            target=_run_section,
+            args=(name, fetch, results),
+            name=f"section-{name}",
+            daemon=True
+        ).start()
+
+    values = {}
+    end = time.monotonic() + deadline
+
+    while pending:
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            name, value = results.get(timeout=remaining)
+        except queue.Empty:
+            break
+
+        title, render = pending.pop(name)
+        values[name] = value
+        try:
+            emit(render(value))
+        except Exception:
+            emit(f"\n{title}:\n  Unable to display")
+
+    for title, render in pending.values():
+        emit(placeholder(title, deadline))
+
+    return values
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+File Watcher - Run a callback when watched files change
+Uses inotify on Linux and falls back to polling mtimes everywhere else
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+
+POLL_INTERVAL = 2.0
+DEBOUNCE = 0.25  # coalesce bursts of events (editor save = several writes)
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+def _load_inotify():
+    """Return libc with inotify, or None if unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+class FileWatcher:
+    """
+    Watch (directory, pattern) pairs and call on_change() once per burst of
+    changes to matching files. Watching the directory (not the file) also
+    catches editors that save by renaming a temp file into place.
+    """
+
+    def __init__(self, watches, on_change, poll_interval=POLL_INTERVAL, debounce=DEBOUNCE):
+        self.watches = [(Path(directory), pattern) for directory, pattern in watches]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.mode = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _fire(self):
+        try:
+            self.on_change()
+        except Exception:
+            pass
+
+    # --- inotify backend ---
+
+    def _open_inotify(self):
+        libc = _load_inotify()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+
+        patterns = {}
+        for directory, pattern in self.watches:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                os.close(fd)
+                return None  # e.g. directory missing - polling copes with that
+            patterns.setdefault(wd, []).append(pattern)
+        return fd, patterns
+
+    def _matching_events(self, fd, patterns):
+        """Read pending events and report whether any touched a watched file"""
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+
+        matched = False
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns.get(wd, ())):
+                matched = True
+        return matched
+
+    def _run_inotify(self, fd, patterns):
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd], [], [], 0.5)
+                if not ready or not self._matching_events(fd, patterns):
+                    continue
+                # Swallow the rest of the burst before regenerating
+                while select.select([fd], [], [], self.debounce)[0]:
+                    self._matching_events(fd, patterns)
+                self._fire()
+        finally:
+            os.close(fd)
+
+    # --- polling backend ---
+
+    def _signature(self):
+        entries = []
+        for directory, pattern in self.watches:
+            try:
+                for path in directory.glob(pattern):
+                    st = path.stat()
+                    entries.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                continue
+        return sorted(entries)
+
+    def _run_polling(self):
+        last = self._signature()
+        while not self._stop.wait(self.poll_interval):
+            current = self._signature()
+            if current != last:
+                last = current
+                self._fire()
+
+    def start(self):
+        """Start watching in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+
+        inotify = self._open_inotify()
+        if inotify is not None:
+            self.mode = "inotify"
+            target, args = self._run_inotify, inotify
+        else:
+            self.mode = "polling"
+            target, args = self._run_polling, ()
+
+        self._thread = threading.Thread(target=target, args=args, name="file-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Stop watching and wait for the thread to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
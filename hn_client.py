@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Hacker News Client - Batched, parallel story fetching
+Keeps connections alive and stops as soon as enough stories are found
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import get_client
+
+HN_API = "https://hacker-news.firebaseio.com/v0"
+MAX_WORKERS = 8
+TIMEOUT = 5
+
+class HNClient:
+    """Hacker News API client with keep-alive connections and an item cache"""
+
+    def __init__(self, max_workers=MAX_WORKERS, timeout=TIMEOUT, http=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.http = http or get_client()  # shared keep-alive connection pool
+        self._top_stories = None
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def top_stories(self):
+        """Top story IDs - fetched once and reused for every pass"""
+        if self._top_stories is None:
+            try:
+                self._top_stories = self.http.get_json(f"{HN_API}/topstories.json", timeout=self.timeout) or []
+            except Exception:
+                return []
+        return self._top_stories
+
+    def item(self, story_id):
+        """Fetch a single item (cached), or None on failure"""
+        with self._lock:
+            if story_id in self._items:
+                return self._items[story_id]
+        try:
+            story = self.http.get_json(f"{HN_API}/item/{story_id}.json", timeout=self.timeout)
+        except Exception:
+            story = None
+        with self._lock:
+            self._items[story_id] = story
+        return story
+
+    def find_stories(self, story_ids, predicate, limit):
+        """
+        Fetch stories in rank order with bounded concurrency and return the
+        first `limit` that satisfy predicate(story). Outstanding requests are
+        cancelled once the quota is filled.
+        """
+        matches = []
+        if limit <= 0:
+            return matches
+
+        ids = iter(story_ids)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            window = deque()
+            for story_id in ids:
+                window.append(pool.submit(self.item, story_id))
+                if len(window) >= self.max_workers:
+                    break
+
+            while window and len(matches) < limit:
+                story = window.popleft().result()
+                next_id = next(ids, None)
+                if next_id is not None:
+                    window.append(pool.submit(self.item, next_id))
+                if story and predicate(story):
+                    matches.append(story)
+
+            for future in window:
+                future.cancel()
+
+        return matches
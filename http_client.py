@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+HTTP Client - Shared in-process HTTP layer for all day-starter fetchers
+Per-host connection pooling, keep-alive, gzip decoding and per-host stats
+"""
+
+import gzip
+import http.client
+import json
+import threading
+import time
+import zlib
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "DayStarter/1.0"
+DEFAULT_TIMEOUT = 10
+MAX_IDLE_PER_HOST = 8
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+class FetchError(Exception):
+    """Raised when a request fails before an HTTP response is received"""
+
+class Response:
+    """A fully-read HTTP response"""
+
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def text(self):
+        """Decode the body using the declared charset (utf-8 by default)"""
+        charset = "utf-8"
+        content_type = self.headers.get("content-type", "")
+        if "charset=" in content_type:
+            charset = content_type.split("charset=")[-1].split(";")[0].strip() or charset
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.body)
+
+def _decode_body(body, encoding):
+    """Undo gzip/deflate content encoding"""
+    encoding = (encoding or "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+class StreamResponse:
+    """An HTTP response whose body is read incrementally"""
+
+    def __init__(self, client, url, key, conn, response, start, deadline):
+        self.url = url
+        self.status = response.status
+        self.headers = {k.lower(): v for k, v in response.getheaders()}
+        self._client = client
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self._start = start
+        self._deadline = deadline
+        self._received = 0
+        self._decoded = 0
+        self._complete = False
+        self._closed = False
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def iter_chunks(self, chunk_size=16384):
+        """Yield decoded body bytes as they arrive off the socket"""
+        encoding = self.headers.get("content-encoding", "").lower()
+        if encoding == "gzip":
+            decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            decoder = zlib.decompressobj()
+        else:
+            decoder = None
+
+        host = self._key[1]
+        while True:
+            self._client._check_deadline(host, self._conn, self._deadline)
+            try:
+                raw = self._response.read1(chunk_size)
+            except (http.client.HTTPException, OSError) as e:
+                raise self._client._error(host, self._conn, e) from e
+            if not raw:
+                self._complete = True
+                break
+            self._received += len(raw)
+            try:
+                data = decoder.decompress(raw) if decoder else raw
+            except zlib.error as e:
+                raise FetchError(f"{host}: bad content encoding ({e})") from e
+            if data:
+                self._decoded += len(data)
+                yield data
+
+        if decoder:
+            tail = decoder.flush()
+            if tail:
+                self._decoded += len(tail)
+                yield tail
+
+    def close(self):
+        """Release the connection (dropped if the body wasn't fully read)"""
+        if self._closed:
+            return
+        self._closed = True
+        complete = self._complete or self._response.isclosed()
+        if not complete and self._response.length == 0:
+            # No body to read (e.g. a 304) - consume the empty body so the
+            # connection goes back to the pool instead of being dropped
+            try:
+                self._response.read()
+                complete = True
+            except (http.client.HTTPException, OSError):
+                pass
+        self._client._finish(self._key, self._conn, self._response, complete)
+        self._client._record(
+            self._key[1], self._received, self._decoded, time.monotonic() - self._start
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class HTTPClient:
+    """Pooled keep-alive HTTP client shared by all fetchers"""
+
+    def __init__(self, max_idle_per_host=MAX_IDLE_PER_HOST, user_agent=USER_AGENT):
+        self.max_idle_per_host = max_idle_per_host
+        self.user_agent = user_agent
+        self._idle = {}   # (scheme, host, port) -> [connection, ...]
+        self._stats = {}  # host -> counters
+        self._lock = threading.Lock()
+
+    def _host_stats(self, host):
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = {
+                "requests": 0,
+                "errors": 0,
+                "connections_opened": 0,
+                "connections_reused": 0,
+                "bytes_received": 0,
+                "bytes_decoded": 0,
+                "latency_total": 0.0,
+                "latency_max": 0.0,
+            }
+        return stats
+
+    def _acquire(self, key, timeout, fresh=False):
+        """Get an idle connection for the host, or open a new one"""
+        scheme, host, port = key
+        with self._lock:
+            idle = None if fresh else self._idle.get(key)
+            conn = idle.pop() if idle else None
+            stats = self._host_stats(host)
+            if conn is not None:
+                stats["connections_reused"] += 1
+            else:
+                stats["connections_opened"] += 1
+
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(host, port, timeout=timeout)
+            return conn, False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, key, conn):
+        """Return a connection to the pool for keep-alive reuse"""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _error(self, host, conn, e):
+        conn.close()
+        with self._lock:
+            self._host_stats(host)["errors"] += 1
+        return FetchError(f"{host}: {e}")
+
+    def _check_deadline(self, host, conn, deadline):
+        """
+        Fail once a request has used up its timeout. The socket timeout only
+        bounds each read, so a server trickling bytes could otherwise hold a
+        fetch forever; each read is also capped at the time left
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise self._error(host, conn, "request timed out")
+        if conn.sock is not None:
+            conn.sock.settimeout(remaining)
+
+    def _record(self, host, received, decoded, elapsed):
+        with self._lock:
+            stats = self._host_stats(host)
+            stats["requests"] += 1
+            stats["bytes_received"] += received
+            stats["bytes_decoded"] += decoded
+            stats["latency_total"] += elapsed
+            stats["latency_max"] = max(stats["latency_max"], elapsed)
+
+    def _open(self, url, deadline, headers):
+        """Send a GET and return (key, conn, response) with the body unread"""
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname
+        if not host:
+            raise FetchError(f"Invalid URL: {url}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        request_headers.update(headers or {})
+
+        conn, reused = self._acquire(key, max(deadline - time.monotonic(), 0.001))
+        try:
+            try:
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # Server dropped the kept-alive socket - retry on a fresh one
+                conn.close()
+                self._check_deadline(host, conn, deadline)
+                conn, reused = self._acquire(key, deadline - time.monotonic(), fresh=True)
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+        except (http.client.HTTPException, OSError) as e:
+            raise self._error(host, conn, e) from e
+
+        return key, conn, response
+
+    def _finish(self, key, conn, response, complete=True):
+        """Pool the connection if the body was fully read and it's reusable"""
+        if complete and not response.will_close:
+            self._release(key, conn)
+        else:
+            conn.close()
+
+    def _request_once(self, url, timeout, headers):
+        start = time.monotonic()
+        deadline = start + timeout
+        key, conn, response = self._open(url, deadline, headers)
+        host = key[1]
+        chunks = []
+        while True:
+            self._check_deadline(host, conn, deadline)
+            try:
+                chunk = response.read1(65536)
+            except (http.client.HTTPException, OSError) as e:
+                raise self._error(host, conn, e) from e
+            if not chunk:
+                break
+            chunks.append(chunk)
+        raw = b"".join(chunks)
+
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        self._finish(key, conn, response)
+
+        try:
+            body = _decode_body(raw, response_headers.get("content-encoding"))
+        except (OSError, EOFError, zlib.error) as e:
+            raise FetchError(f"{host}: bad content encoding ({e})") from e
+
+        self._record(host, len(raw), len(body), time.monotonic() - start)
+        return Response(url, response.status, response_headers, body)
+
+    def get(self, url, timeout=DEFAULT_TIMEOUT, headers=None, max_redirects=MAX_REDIRECTS):
+        """
+        GET a URL and return a Response (for any HTTP status).
+        Follows redirects; raises FetchError on network failures.
+        """
+        if "://" not in url:
+            url = "https://" + url
+
+        for _ in range(max_redirects + 1):
+            response = self._request_once(url, timeout, headers)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response
+            url = urljoin(url, location)
+
+        raise FetchError(f"Too many redirects: {url}")
+
+    def stream(self, url, timeout=DEFAULT_TIMEOUT, headers=None, max_redirects=MAX_REDIRECTS):
+        """
+        GET a URL and return a StreamResponse whose body is read on demand.
+        Use it as a context manager; closing it early drops the connection
+        instead of downloading the rest of the body.
+        """
+        if "://" not in url:
+            url = "https://" + url
+
+        for _ in range(max_redirects + 1):
+            start = time.monotonic()
+            deadline = start + timeout
+            key, conn, response = self._open(url, deadline, headers)
+            location = response.getheader("location")
+            if response.status not in REDIRECT_CODES or not location:
+                return StreamResponse(self, url, key, conn, response, start, deadline)
+            try:
+                response.read()
+            except (http.client.HTTPException, OSError) as e:
+                raise self._error(key[1], conn, e) from e
+            self._finish(key, conn, response)
+            url = urljoin(url, location)
+
+        raise FetchError(f"Too many redirects: {url}")
+
+    def get_json(self, url, timeout=DEFAULT_TIMEOUT, headers=None):
+        """GET a URL and decode JSON, or None on any non-2xx status"""
+        response = self.get(url, timeout=timeout, headers=headers)
+        if not response.ok:
+            return None
+        return response.json()
+
+    def stats(self):
+        """Per-host counters: requests, bytes, connection reuse and latency"""
+        with self._lock:
+            snapshot = {}
+            for host, stats in self._stats.items():
+                host_stats = dict(stats)
+                requests = host_stats["requests"]
+                host_stats["latency_avg"] = host_stats["latency_total"] / requests if requests else 0.0
+                snapshot[host] = host_stats
+            return snapshot
+
+    def close(self):
+        """Close every idle pooled connection"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+# Shared client used by every fetcher in the process
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Return the process-wide shared HTTPClient"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient()
+    return _client
+
+def get(url, **kwargs):
+    """GET using the shared client"""
+    return get_client().get(url, **kwargs)
+
+def get_json(url, **kwargs):
+    """GET and decode JSON using the shared client"""
+    return get_client().get_json(url, **kwargs)
+
+def stream(url, **kwargs):
+    """Streaming GET using the shared client"""
+    return get_client().stream(url, **kwargs)
+
+def stats():
+    """Per-host counters for the shared client"""
+    return get_client().stats()
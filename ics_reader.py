@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+ICS Reader - Streaming iCalendar parser with windowed recurrence expansion
+Reads .ics exports (or directories of them, e.g. CalDAV dumps) line by line,
+keeps one VEVENT in memory at a time, and expands RRULEs only inside the
+requested window - jumping straight to it instead of walking years of history
+"""
+
+import calendar
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+
+import timeservice
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+KEPT_PROPERTIES = ("DTSTART", "SUMMARY", "UID", "RRULE", "EXDATE", "RECURRENCE-ID", "STATUS")
+MAX_OCCURRENCES = 10000  # guard against runaway COUNT rules
+# Rule parts we can't expand correctly - such rules are skipped rather than
+# shown on wrong dates
+UNSUPPORTED_PARTS = ("BYSETPOS", "BYWEEKNO", "BYYEARDAY", "BYHOUR", "BYMINUTE", "BYSECOND")
+
+_tz_cache = {}
+
+def _tz(name):
+    """ZoneInfo for a TZID, or None (floating / unknown zones use the user's time zone)"""
+    if name not in _tz_cache:
+        try:
+            _tz_cache[name] = ZoneInfo(name.strip('"')) if ZoneInfo else None
+        except Exception:
+            _tz_cache[name] = None
+    return _tz_cache[name]
+
+# --- Streaming -----------------------------------------------------------------
+
+def iter_ics_files(path):
+    """The .ics files at path (a file, or every .ics under a directory)"""
+    path = Path(path).expanduser()
+    if path.is_dir():
+        yield from sorted(path.rglob("*.ics"))
+    elif path.exists():
+        yield path
+
+def iter_unfolded(f):
+    """Yield logical lines from a file, joining RFC 5545 folded continuations"""
+    pending = None
+    for raw in f:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if pending is not None:
+                pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+def _unescape(value):
+    return value.replace("\\n", " ").replace("\\N", " ").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+def iter_vevents(lines):
+    """
+    Yield each VEVENT as {name: (params, value)} (EXDATE as a list), skipping
+    nested components like VALARM. Only properties we use are kept.
+    """
+    event = None
+    depth = 0
+    for line in lines:
+        if line.startswith("BEGIN:"):
+            if line == "BEGIN:VEVENT":
+                event, depth = {}, 0
+            elif event is not None:
+                depth += 1
+            continue
+        if line.startswith("END:"):
+            if event is not None:
+                if line == "END:VEVENT" and depth == 0:
+                    yield event
+                    event = None
+                elif depth:
+                    depth -= 1
+            continue
+        if event is None or depth or ":" not in line:
+            continue
+
+        head, value = line.split(":", 1)
+        name, *params = head.split(";")
+        name = name.upper()
+        if name not in KEPT_PROPERTIES:
+            continue
+        if name == "EXDATE":
+            event.setdefault("EXDATE", []).append((params, value))
+        else:
+            event[name] = (params, value)
+
+# --- Dates ------------------------------------------------------------------------
+
+def parse_ics_datetime(params, value):
+    """
+    Parse a DTSTART-style value. Returns (datetime, all_day): all-day values
+    give midnight in the user's time zone, others an aware datetime.
+    """
+    value = value.strip()
+    if any(p.upper() == "VALUE=DATE" for p in params) or len(value) == 8:
+        day = datetime.strptime(value[:8], "%Y%m%d")
+        return day.replace(tzinfo=timeservice.user_tz()), True
+
+    naive = datetime.strptime(value.rstrip("Z")[:15], "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        return naive.replace(tzinfo=timezone.utc), False
+    for param in params:
+        if param.upper().startswith("TZID="):
+            tz = _tz(param[5:])
+            if tz is not None:
+                return naive.replace(tzinfo=tz), False
+    return naive.replace(tzinfo=timeservice.user_tz()), False
+
+def _parse_until(value, tz):
+    dt, all_day = parse_ics_datetime([], value)
+    if all_day:
+        # UNTIL=YYYYMMDD includes that whole day
+        return datetime.combine(dt.date(), time.max).replace(tzinfo=tz)
+    return dt
+
+def parse_rrule(value):
+    """RRULE text -> dict of upper-cased keys to values"""
+    rule = {}
+    for part in value.split(";"):
+        if "=" in part:
+            key, val = part.split("=", 1)
+            rule[key.upper()] = val.upper()
+    return rule
+
+def _byday(rule):
+    """[(ordinal or None, weekday)] from BYDAY=1MO,-1FR,TU"""
+    days = []
+    for item in filter(None, rule.get("BYDAY", "").split(",")):
+        code = item[-2:]
+        if code in WEEKDAYS:
+            days.append((int(item[:-2]) if item[:-2] else None, WEEKDAYS[code]))
+    return days
+
+def _ints(rule, key):
+    return [int(v) for v in filter(None, rule.get(key, "").split(",")) if v.lstrip("-").isdigit()]
+
+def _add_months(year, month, delta):
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+def _weekday_days(days, byday):
+    """Members of `days` (dates, in order) picked by BYDAY - ordinals count within `days`"""
+    picked = set()
+    for ordinal, weekday in byday:
+        matches = [d for d in days if d.weekday() == weekday]
+        if ordinal is None:
+            picked.update(matches)
+        elif ordinal != 0 and -len(matches) <= ordinal <= len(matches):
+            picked.add(matches[ordinal - 1] if ordinal > 0 else matches[ordinal])
+    return picked
+
+def _monthday_days(days, monthdays):
+    """Members of `days` matching BYMONTHDAY (negative values count from month end)"""
+    picked = set()
+    for d in days:
+        last = calendar.monthrange(d.year, d.month)[1]
+        if d.day in monthdays or d.day - last - 1 in monthdays:
+            picked.add(d)
+    return picked
+
+def _limit(days, rule):
+    """
+    Apply BYDAY and BYMONTHDAY to candidate dates. Per RFC 5545 each BY* part
+    limits the others, so when both are present only dates matching both stay.
+    None if neither part is present.
+    """
+    byday = _byday(rule)
+    monthdays = set(_ints(rule, "BYMONTHDAY"))
+    if not byday and not monthdays:
+        return None
+    picked = set(days)
+    if byday:
+        picked &= _weekday_days(days, byday)
+    if monthdays:
+        picked &= _monthday_days(days, monthdays)
+    return sorted(picked)
+
+def _dates(year, month_from, month_to):
+    """Every date from the start of month_from to the end of month_to in a year"""
+    first = date(year, month_from, 1)
+    last = date(year, month_to, calendar.monthrange(year, month_to)[1])
+    return [first + timedelta(days=n) for n in range((last - first).days + 1)]
+
+def _month_days(year, month, rule, default_day):
+    """Dates in a month an occurrence falls on, per BYDAY / BYMONTHDAY"""
+    limited = _limit(_dates(year, month, month), rule)
+    if limited is not None:
+        return limited
+    if default_day <= calendar.monthrange(year, month)[1]:
+        return [date(year, month, default_day)]
+    return []  # e.g. the 31st in a 30-day month is skipped, not moved
+
+def _year_days(year, rule, start):
+    """Dates in a year for FREQ=YEARLY"""
+    months = _ints(rule, "BYMONTH")
+    if months:
+        # BYDAY ordinals count within each listed month
+        return [d for month in sorted(set(months)) for d in _month_days(year, month, rule, start.day)]
+    # Without BYMONTH, BYDAY ordinals count within the whole year
+    limited = _limit(_dates(year, 1, 12), rule)
+    if limited is not None:
+        return limited
+    return _month_days(year, start.month, rule, start.day)
+
+def _period_candidates(freq, rule, start, period):
+    """Naive wall-clock starts in the `period`-th period after start (unsorted)"""
+    wall = start.time()
+    if freq == "DAILY":
+        yield datetime.combine(start.date() + timedelta(days=period), wall)
+    elif freq == "WEEKLY":
+        week_start = start.date() - timedelta(days=start.weekday()) + timedelta(weeks=period)
+        weekdays = [wd for _, wd in _byday(rule)] or [start.weekday()]
+        for weekday in sorted(set(weekdays)):
+            yield datetime.combine(week_start + timedelta(days=weekday), wall)
+    elif freq == "MONTHLY":
+        year, month = _add_months(start.year, start.month, period)
+        for day in _month_days(year, month, rule, start.day):
+            yield datetime.combine(day, wall)
+    elif freq == "YEARLY":
+        for day in _year_days(start.year + period, rule, start):
+            yield datetime.combine(day, wall)
+
+def _periods_before(freq, start, moment):
+    """Whole periods between start and moment (lower bound, never negative)"""
+    if freq == "DAILY":
+        n = (moment.date() - start.date()).days
+    elif freq == "WEEKLY":
+        n = (moment.date() - start.date()).days // 7
+    elif freq == "MONTHLY":
+        n = (moment.year - start.year) * 12 + moment.month - start.month
+    else:
+        n = moment.year - start.year
+    return max(n - 1, 0)  # one period of slack for time zone differences
+
+def expand(start, rule, window_start, window_end, exdates=()):
+    """
+    Occurrence starts of a recurring event inside [window_start, window_end).
+    Without COUNT, expansion starts at the period just before the window
+    rather than at DTSTART, so cost doesn't grow with the event's age.
+    """
+    freq = rule.get("FREQ")
+    if freq not in ("DAILY", "WEEKLY", "MONTHLY", "YEARLY") or any(part in rule for part in UNSUPPORTED_PARTS):
+        return []
+    tz = start.tzinfo
+    interval = max(int(rule.get("INTERVAL", "1") or 1), 1)
+    count = int(rule["COUNT"]) if rule.get("COUNT", "").isdigit() else None
+    until = _parse_until(rule["UNTIL"], tz) if rule.get("UNTIL") else None
+    months = set(_ints(rule, "BYMONTH")) if freq != "YEARLY" else set()
+    weekdays = {wd for _, wd in _byday(rule)} if freq == "DAILY" else set()
+    monthdays = set(_ints(rule, "BYMONTHDAY")) if freq in ("DAILY", "WEEKLY") else set()
+
+    period = 0
+    if count is None:
+        period = _periods_before(freq, start, window_start.astimezone(tz)) // interval * interval
+
+    # Filters that can never match (e.g. BYMONTH=6;BYMONTHDAY=31) reject every
+    # candidate, so the loop is bounded by the window, not by matches
+    last_period = _periods_before(freq, start, window_end.astimezone(tz)) + 2
+    found = []
+    seen = 0
+    while seen < MAX_OCCURRENCES and period <= last_period:
+        try:
+            candidates = sorted(_period_candidates(freq, rule, start, period))
+        except (OverflowError, ValueError):
+            break  # walked off the calendar: the series ends here
+        for naive in candidates:
+            occurrence = naive.replace(tzinfo=tz)
+            if occurrence < start:
+                continue
+            if until is not None and occurrence > until:
+                return found
+            if occurrence >= window_end:
+                return found
+            if months and naive.month not in months:
+                continue
+            if weekdays and naive.weekday() not in weekdays:
+                continue
+            if monthdays and not _monthday_days([naive.date()], monthdays):
+                continue
+            seen += 1
+            if count is not None and seen > count:
+                return found
+            if occurrence >= window_start and occurrence not in exdates:
+                found.append(occurrence)
+        period += interval
+    return found
+
+# --- Queries ----------------------------------------------------------------------
+
+def _quick_outside(value, first_day, last_day):
+    """Cheap string test: is a non-recurring DTSTART clearly outside the window days?"""
+    day = value.strip()[:8]
+    return not day.isdigit() or day < first_day or day > last_day
+
+def occurrences(paths, window_start, window_end):
+    """
+    Stream events from .ics files/directories and return
+    [(start, all_day, title, uid)] starting inside the window, sorted.
+    window_start / window_end are aware datetimes.
+    """
+    # One day of slack either side for events stored in other time zones
+    first_day = (window_start - timedelta(days=1)).strftime("%Y%m%d")
+    last_day = (window_end + timedelta(days=1)).strftime("%Y%m%d")
+
+    found = {}
+    overridden = set()
+    for path in paths:
+        for ics_file in iter_ics_files(path):
+            with open(ics_file, encoding="utf-8", errors="replace") as f:
+                for event in iter_vevents(iter_unfolded(f)):
+                    uid = _unescape(event.get("UID", ([], ""))[1].strip())
+                    is_override = "RECURRENCE-ID" in event
+                    if is_override:
+                        # A moved, edited or cancelled instance replaces the rule's original
+                        # occurrence - recorded before any filtering, since the instance
+                        # may have moved out of (or been cancelled inside) the window
+                        rid_params, rid_value = event["RECURRENCE-ID"]
+                        if not _quick_outside(rid_value, first_day, last_day):
+                            try:
+                                overridden.add((uid, parse_ics_datetime(rid_params, rid_value)[0]))
+                            except ValueError:
+                                pass
+
+                    if "DTSTART" not in event:
+                        continue
+                    if event.get("STATUS", ([], ""))[1].strip().upper() == "CANCELLED":
+                        continue
+                    params, value = event["DTSTART"]
+                    # An override is a single instance: judged by its own DTSTART
+                    recurring = "RRULE" in event and not is_override
+                    if not recurring and _quick_outside(value, first_day, last_day):
+                        continue
+                    try:
+                        start, all_day = parse_ics_datetime(params, value)
+                    except ValueError:
+                        continue
+
+                    title = _unescape(event.get("SUMMARY", ([], "Untitled"))[1].strip()) or "Untitled"
+
+                    if recurring:
+                        exdates = set()
+                        for ex_params, ex_value in event.get("EXDATE", []):
+                            for item in ex_value.split(","):
+                                try:
+                                    exdates.add(parse_ics_datetime(ex_params, item)[0])
+                                except ValueError:
+                                    pass
+                        starts = expand(start, parse_rrule(event["RRULE"][1]), window_start, window_end, exdates)
+                    else:
+                        starts = [start] if window_start <= start < window_end else []
+
+                    for occurrence in starts:
+                        found[(uid, occurrence, is_override)] = (occurrence, all_day, title, uid)
+
+    results = [
+        value for (uid, occurrence, is_override), value in found.items()
+        if is_override or (uid, occurrence) not in overridden
+    ]
+    return sorted(results, key=lambda item: (item[0], item[2]))
+
+def today_events(paths, day=None):
+    """Today's events as (time, title) tuples, the shape format_calendar() takes"""
+    events = []
+    for start, all_day, title, uid in occurrences(paths, *timeservice.day_window(day)):
+        events.append(("All day" if all_day else timeservice.local(start).strftime("%H:%M"), title))
+    return events
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher - Compiled multi-keyword relevance matching for news
+Builds one trie-shaped regex from a keyword list, so matching cost doesn't
+grow with the number of keywords, and only matches whole words
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+Match = namedtuple("Match", ["keywords", "score"])
+
+# Suffixes accepted after a keyword ("stock" also matches "stocks")
+PLURAL_SUFFIX = r"(?:e?s)?"
+
+def _normalise(keyword):
+    return " ".join(keyword.lower().split())
+
+def _trie_regex(words):
+    """Build a regex alternation from a trie so shared prefixes are matched once"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        end = "" in node
+        branches = []
+        for char in sorted(k for k in node if k):
+            atom = r"\s+" if char == " " else re.escape(char)
+            branches.append(atom + build(node[char]))
+        if not branches:
+            return ""
+        if len(branches) == 1 and not end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if end else group
+
+    return build(trie)
+
+class KeywordMatcher:
+    """Whole-word, case-insensitive matcher over a fixed keyword list"""
+
+    def __init__(self, keywords, whole_words=True, plurals=True):
+        self.keywords = tuple(dict.fromkeys(_normalise(kw) for kw in keywords if kw.strip()))
+        self._lookup = {kw: kw for kw in self.keywords}
+
+        if not self.keywords:
+            self._pattern = None
+            return
+
+        body = "(?:" + _trie_regex(self.keywords) + ")"
+        if plurals:
+            body += PLURAL_SUFFIX
+        if whole_words:
+            body = r"(?<!\w)" + body + r"(?!\w)"
+        self._pattern = re.compile(body, re.IGNORECASE)
+
+    def _keyword(self, matched):
+        """Map matched text back to the keyword that produced it"""
+        text = _normalise(matched)
+        if text in self._lookup:
+            return self._lookup[text]
+        for suffix in ("es", "s"):
+            if text.endswith(suffix) and text[:-len(suffix)] in self._lookup:
+                return self._lookup[text[:-len(suffix)]]
+        return text
+
+    def search(self, text):
+        """True if any keyword appears in text"""
+        return bool(text and self._pattern and self._pattern.search(text))
+
+    def match(self, text):
+        """Return Match(keywords, score): distinct keywords hit and total hit count"""
+        if not text or not self._pattern:
+            return Match((), 0)
+        hits = [self._keyword(m.group(0)) for m in self._pattern.finditer(text)]
+        return Match(tuple(dict.fromkeys(hits)), len(hits))
+
+@lru_cache(maxsize=32)
+def _cached_matcher(keywords, whole_words, plurals):
+    return KeywordMatcher(keywords, whole_words, plurals)
+
+def matcher_for(keywords, whole_words=True, plurals=True):
+    """Return a (cached) compiled matcher for a keyword list"""
+    return _cached_matcher(tuple(keywords), whole_words, plurals)
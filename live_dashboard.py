@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Live Dashboard - Keep the rendered dashboard in memory for the server
+Re-renders only when KANBAN.md or memory/*.md change, so requests are
+served from memory with an ETag and never touch the disk. The page is kept
+as the renderer's chunk list (static shell chunks are shared, not copied),
+alongside version-stamped board sections for incremental /api/board refreshes
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+import dashboard
+from file_watcher import FileWatcher
+import timeservice
+
+def dashboard_watches():
+    """(directory, pattern) pairs the dashboard is rendered from"""
+    return [
+        (dashboard.KANBAN_FILE.parent, dashboard.KANBAN_FILE.name),
+        (dashboard.MEMORY_DIR, "*.md"),
+    ]
+
+class VersionedBoard:
+    """
+    Board sections stamped with the version at which they last changed.
+    Versions only grow within an epoch (one server process), so a client
+    holding (epoch, version) can ask for just the sections changed since.
+    """
+
+    def __init__(self):
+        self.epoch = format(time.time_ns(), "x")
+        self.version = 0
+        self.updated = None
+        self._sections = {}   # name -> (version, digest, data)
+        self._lock = threading.Lock()
+
+    def update(self, board):
+        """Record a new board, bumping the version of sections that changed"""
+        with self._lock:
+            changed = False
+            for name, data in board.items():
+                digest = hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+                current = self._sections.get(name)
+                if current and current[1] == digest:
+                    continue
+                if not changed:
+                    self.version += 1
+                    self.updated = timeservice.now().strftime("%Y-%m-%d %H:%M:%S")
+                    changed = True
+                self._sections[name] = (self.version, digest, data)
+            return self.epoch, self.version
+
+    def delta(self, since=0, epoch=None):
+        """Sections newer than `since`; everything if epoch is from another process"""
+        with self._lock:
+            if epoch != self.epoch:
+                since = 0
+            return {
+                "epoch": self.epoch,
+                "since": since,
+                "version": self.version,
+                "updated": self.updated,
+                "sections": {
+                    name: {"version": version, "data": data}
+                    for name, (version, digest, data) in self._sections.items()
+                    if version > since
+                },
+            }
+
+class LiveDashboard:
+    """Rendered dashboard chunks plus ETag, refreshed by a file watcher"""
+
+    def __init__(self, load=dashboard.board_data, render=dashboard.iter_html, watches=None,
+                 on_update=None):
+        self.load = load
+        self.render = render
+        self.watches = watches if watches is not None else dashboard_watches()
+        self.on_update = on_update  # called with the board delta whenever a section changes
+        self.board = VersionedBoard()
+        self.rendered_at = None
+        self.last_error = None
+        self._chunks = None
+        self._etag = None
+        self._lock = threading.Lock()
+        self._render_lock = threading.RLock()
+        self._watcher = None
+
+    def refresh(self):
+        """Re-render and swap in the new page"""
+        with self._render_lock:
+            chunks = []
+            digest = hashlib.sha1()
+            try:
+                board = self.load()
+                previous = self.board.version
+                version = self.board.update(board)
+                # Stamp the page with the board's change time, not the render time,
+                # so the ETag only moves when the board does
+                for chunk in self.render(board, version, self.board.updated):
+                    chunks.append(chunk)
+                    digest.update(chunk)
+            except Exception as e:
+                self.last_error = str(e)
+                return False
+
+            etag = digest.hexdigest()[:20]
+            with self._lock:
+                if etag != self._etag:
+                    self._chunks = tuple(chunks)
+                    self._etag = etag
+                self.rendered_at = time.time()
+                self.last_error = None
+
+            if self.on_update and version[1] != previous:
+                try:
+                    self.on_update(self.board.delta(previous, version[0]))
+                except Exception:
+                    pass
+            return True
+
+    def get(self):
+        """Return (chunks, etag), rendering on first use"""
+        if self._chunks is None:
+            with self._render_lock:  # concurrent first requests share one render
+                if self._chunks is None:
+                    self.refresh()
+        with self._lock:
+            return self._chunks, self._etag
+
+    def delta(self, since=0, epoch=None):
+        """Board sections changed since (epoch, version), rendering on first use"""
+        self.get()
+        return self.board.delta(since, epoch)
+
+    def start(self):
+        """Render once and start watching for changes (idempotent)"""
+        if self._watcher is None:
+            self.refresh()
+            self._watcher = FileWatcher(self.watches, self.refresh).start()
+        return self
+
+    def stop(self):
+        """Stop watching for changes"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
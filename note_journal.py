@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Note Journal - Crash-safe quick-note capture for the daily planning note
+Notes are appended to a journal by a single writer thread that commits
+whatever is queued in one write + fsync (group commit), under a file lock
+shared with every other process. The journal is later compacted into
+~/Documents/DayStarters/<date>.md by appending in place (the user may have
+the note open in an editor), tagged so a replay after a crash is a no-op
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import timeservice
+
+CONFIG_DIR = Path.home() / ".config" / "daystarter"
+JOURNAL_FILE = CONFIG_DIR / "notes.journal"
+NOTES_DIR = Path.home() / "Documents" / "DayStarters"
+
+MAX_BATCH = 256      # notes per group commit
+COMPACT_DELAY = 1.0  # seconds of quiet before folding the journal into notes
+
+class _Pending:
+    """A queued note and the event its caller waits on"""
+
+    __slots__ = ("record", "done", "error")
+
+    def __init__(self, record):
+        self.record = record
+        self.done = threading.Event()
+        self.error = None
+
+class NoteJournal:
+    """Append-only note journal with a group-committing writer thread"""
+
+    def __init__(self, path=JOURNAL_FILE, notes_dir=NOTES_DIR, max_batch=MAX_BATCH,
+                 compact_delay=COMPACT_DELAY):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.notes_dir = Path(notes_dir)
+        self.max_batch = max_batch
+        self.compact_delay = compact_delay
+        self.commits = 0
+        self.notes_committed = 0
+        self._queue = queue.Queue()
+        self._dirty = False
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock shared by writers and compaction in every process"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def start(self):
+        """Start the writer thread (idempotent)"""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="note-journal", daemon=True)
+                self._thread.start()
+        return self
+
+    def append(self, note, date=None):
+        """Queue a note and return once it is durably in the journal"""
+        record = {
+            "id": os.urandom(6).hex(),
+            "date": date or timeservice.today().isoformat(),
+            "note": note,
+            "at": time.time(),
+        }
+        pending = _Pending(record)
+        self.start()
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error:
+            raise pending.error
+        return record
+
+    def _commit(self, batch):
+        """Write a batch of notes with one write and one fsync"""
+        data = "".join(json.dumps(p.record, ensure_ascii=False) + "\n" for p in batch).encode("utf-8")
+        try:
+            with self._locked():
+                fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o600)
+                try:
+                    # Never glue a record onto a torn tail left by a crash
+                    size = os.fstat(fd).st_size
+                    if size and os.pread(fd, 1, size - 1) != b"\n":
+                        data = b"\n" + data
+                    os.write(fd, data)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self.commits += 1
+            self.notes_committed += len(batch)
+            self._dirty = True
+        except OSError as e:
+            for pending in batch:
+                pending.error = e
+        for pending in batch:
+            pending.done.set()
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.compact_delay if self._dirty else None)
+            except queue.Empty:
+                self.compact()
+                continue
+            if first is None:
+                break
+
+            # Everything that queued up while the last fsync ran goes in this commit
+            batch = [first]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+            if stop:
+                break
+
+    def _read_journal(self):
+        records = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue  # torn tail from a crash mid-write
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _write_journal(self, records):
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _marker(record):
+        """Tag identifying one journal record in the note file"""
+        key = record.get("id") or hashlib.sha1(f"{record.get('at')}:{record.get('note')}".encode()).hexdigest()[:12]
+        return f"<!-- journal:{key} -->"
+
+    def _append_to_note(self, date, records):
+        """
+        Append the day's notes to its note file in place (O_APPEND - never a
+        rewrite that could lose an editor's save). Each line carries its
+        record's marker, so if a crash left records in the journal, the
+        replay skips exactly the ones already written.
+        """
+        self.notes_dir.mkdir(parents=True, exist_ok=True)
+        note_path = self.notes_dir / f"{date}.md"
+        try:
+            existing = note_path.read_text(errors="replace")
+        except FileNotFoundError:
+            existing = ""
+        lines = [f"\n- {r['note']} {self._marker(r)}" for r in records if self._marker(r) not in existing]
+        if not lines:
+            return
+
+        data = "".join(lines).encode("utf-8")
+        fd = os.open(note_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def compact(self):
+        """Fold journaled notes into their daily note files; returns notes moved"""
+        moved = 0
+        try:
+            with self._locked():
+                self._dirty = False
+                records = self._read_journal()
+                dates = list(dict.fromkeys(r["date"] for r in records))
+                for date in dates:
+                    notes = [r for r in records if r["date"] == date]
+                    self._append_to_note(date, notes)
+                    # Drop the day from the journal right away; a crash before this
+                    # replays its records, which _append_to_note finds and skips
+                    records = [r for r in records if r["date"] != date]
+                    if records:
+                        self._write_journal(records)
+                    else:
+                        self.path.unlink(missing_ok=True)
+                    moved += len(notes)
+        except OSError:
+            self._dirty = True  # try again after the next quiet period
+        return moved
+
+    def close(self):
+        """Flush queued notes, stop the writer and compact"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.compact()
+
+_journal = None
+_journal_lock = threading.Lock()
+
+def get_journal():
+    """Shared journal for this process"""
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = NoteJournal().start()
+    return _journal
+
+def capture(note, date=None, compact=False):
+    """Durably record a quick note; compact=True also writes it into the note file now"""
+    journal = get_journal()
+    record = journal.append(note, date)
+    if compact:
+        journal.compact()
+    return record
+
+def close():
+    """Flush and compact the shared journal, if this process opened one"""
+    with _journal_lock:
+        journal = _journal
+    if journal is not None:
+        journal.close()
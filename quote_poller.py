@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Quote Poller - Background watchlist refresh for the dashboard server
+One thread polls stock_prices on an interval and keeps recent ticks per
+symbol in fixed-size ring buffers, so upstream load doesn't grow with the
+number of clients and sparkline history comes for free
+"""
+
+import threading
+import time
+from array import array
+
+import stock_prices
+import timeservice
+
+POLL_INTERVAL = 60           # seconds, while the US market is open
+CLOSED_POLL_INTERVAL = 15 * 60
+HISTORY_SIZE = 390           # one trading session of one-minute ticks
+
+class RingBuffer:
+    """Fixed-capacity ring of (timestamp, value) samples backed by arrays"""
+
+    def __init__(self, capacity=HISTORY_SIZE):
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._start = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, value):
+        index = (self._start + self._count) % self.capacity
+        self._times[index] = timestamp
+        self._values[index] = value
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def latest(self):
+        """Most recent (timestamp, value), or None if empty"""
+        if not self._count:
+            return None
+        index = (self._start + self._count - 1) % self.capacity
+        return self._times[index], self._values[index]
+
+    def samples(self):
+        """All samples, oldest first"""
+        end = self._start + self._count
+        if end <= self.capacity:
+            times = self._times[self._start:end]
+            values = self._values[self._start:end]
+        else:
+            wrap = end - self.capacity
+            times = self._times[self._start:] + self._times[:wrap]
+            values = self._values[self._start:] + self._values[:wrap]
+        return list(zip(times, values))
+
+class QuotePoller:
+    """Polls the watchlist in the background and serves the latest snapshot"""
+
+    def __init__(self, fetch=stock_prices.fetch_quotes, interval=POLL_INTERVAL,
+                 closed_interval=CLOSED_POLL_INTERVAL, history_size=HISTORY_SIZE,
+                 on_update=None):
+        self.fetch = fetch
+        self.on_update = on_update  # called with (quotes, updated_at) when a price moves
+        self.interval = interval
+        self.closed_interval = closed_interval
+        self.history_size = history_size
+        self.updated_at = None
+        self.last_error = None
+        self._quotes = []
+        self._history = {}
+        self._lock = threading.Lock()
+        self._poll_lock = threading.RLock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """Fetch once and record the results"""
+        with self._poll_lock:
+            try:
+                quotes = self.fetch()
+            except Exception as e:
+                self.last_error = str(e)
+                return False
+
+            now = time.time()
+            changed = False
+            with self._lock:
+                self._quotes = quotes
+                for quote in quotes:
+                    if not quote.ok:
+                        continue
+                    ring = self._history.get(quote.symbol)
+                    if ring is None:
+                        ring = self._history[quote.symbol] = RingBuffer(self.history_size)
+                    latest = ring.latest()
+                    # Only record moves - a closed market would otherwise flatline the buffer
+                    if latest is None or latest[1] != quote.close:
+                        ring.append(now, quote.close)
+                        changed = True
+                self.updated_at = now
+                self.last_error = None
+            self._ready.set()
+
+            if changed and self.on_update:
+                try:
+                    self.on_update(quotes, now)
+                except Exception:
+                    pass
+            return True
+
+    def ensure_ready(self):
+        """Poll synchronously if nothing has been fetched yet (first request)"""
+        if self.updated_at is None:
+            with self._poll_lock:  # concurrent first requests share one fetch
+                if self.updated_at is None:
+                    self.poll()
+
+    def wait_ready(self, timeout=None):
+        """Wait for the background thread's first poll; True once data exists"""
+        return self._ready.wait(timeout)
+
+    def snapshot(self):
+        """Return (quotes, updated_at) from the last poll"""
+        with self._lock:
+            return list(self._quotes), self.updated_at
+
+    def history(self, symbol=None):
+        """Recent (timestamp, close) ticks for one symbol, or a dict for all"""
+        with self._lock:
+            if symbol is not None:
+                ring = self._history.get(symbol)
+                return ring.samples() if ring else []
+            return {sym: ring.samples() for sym, ring in self._history.items()}
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll()
+            interval = self.interval if timeservice.market_open("US") else self.closed_interval
+            self._stop.wait(interval)
+
+    def start(self):
+        """Start the background thread (idempotent)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="quote-poller", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Stop polling and wait for the thread to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -4,22 +4,25 @@ Jarvis Remote Dashboard Server
 Web dashboard + API endpoints + Telegram bot integration
 """
 
-import subprocess
+import argparse
 import sys
+import threading
+import time
 from pathlib import Path
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 # Import existing tools
 sys.path.insert(0, str(Path.home() / ".openclaw" / "workspace"))
 
 try:
-    import dashboard as dash_mod
+    from live_dashboard import LiveDashboard
     HAS_DASHBOARD = True
 except:
     HAS_DASHBOARD = False
 
 try:
     import stock_prices as stock_mod
+    from quote_poller import POLL_INTERVAL, QuotePoller
     HAS_STOCKS = True
 except:
     HAS_STOCKS = False
@@ -30,12 +33,112 @@ try:
 except:
     HAS_DAYSTARTER = False
 
+try:
+    import config
+except ImportError:
+    config = None
+
+from broadcaster import Broadcaster
+from file_watcher import FileWatcher
+import note_journal
+import snapshot_store
+import wsgi_server
+
 # Initialize Flask app
 app = Flask(__name__)
 
 # Simple token for authentication (configure in production)
 AUTH_TOKEN = "jarvis-2026"  # TODO: Move to config
 
+# How long /api/stocks waits for the poller's first fetch before answering "pending"
+STOCK_READY_TIMEOUT = 5
+# Reconnect hint for a live-update stream refused at the limit (ms)
+STREAM_REFUSED_RETRY_MS = 60000
+
+# Day-starter planning notes (watched for live updates, /api/memo lands here)
+NOTES_DIR = note_journal.NOTES_DIR
+
+def stream_limit(workers):
+    """
+    Live-update streams never end, so each holds a worker for as long as its
+    tab is open. Only half the pool may be streams - the rest stays free for
+    page loads and API calls, and extra tabs poll /api/board instead
+    """
+    return max(1, workers // 2)
+
+_broadcaster = Broadcaster(max_clients=stream_limit(wsgi_server.DEFAULT_WORKERS))
+_event_sources_started = False
+_event_sources_lock = threading.Lock()
+_notes_watcher = None
+
+_quote_poller = None
+_quote_poller_lock = threading.Lock()
+
+_live_dashboard = None
+_live_dashboard_lock = threading.Lock()
+
+def get_live_dashboard():
+    """Shared in-memory dashboard, re-rendered when its source files change"""
+    global _live_dashboard
+    with _live_dashboard_lock:
+        if _live_dashboard is None:
+            _live_dashboard = LiveDashboard(on_update=publish_board).start()
+    return _live_dashboard
+
+def dashboard_response():
+    """Stream the rendered dashboard from memory (304 if the client's copy is current)"""
+    chunks, etag = get_live_dashboard().get()
+    if chunks is None:
+        raise RuntimeError(get_live_dashboard().last_error or "Dashboard render failed")
+    response = Response(iter(chunks), mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def get_quote_poller():
+    """Shared background quote poller, started on first use"""
+    global _quote_poller
+    with _quote_poller_lock:
+        if _quote_poller is None:
+            _quote_poller = QuotePoller(interval=getattr(config, 'STOCK_POLL_INTERVAL', POLL_INTERVAL),
+                                        on_update=publish_stocks).start()
+    return _quote_poller
+
+def publish_board(delta):
+    """Push changed kanban / memory sections to SSE clients"""
+    _broadcaster.publish("board", delta)
+
+def publish_stocks(quotes, updated_at):
+    """Push a moved stock snapshot to SSE clients"""
+    _broadcaster.publish("stocks", {
+        "stocks": [quote._asdict() for quote in quotes],
+        "table": stock_mod.format_quotes(quotes),
+        "updated_at": updated_at
+    })
+
+def publish_daystarter():
+    """Tell SSE clients the day-starter notes or prefetched snapshot changed"""
+    _broadcaster.publish("daystarter", {"changed_at": time.time()})
+
+def start_event_sources():
+    """Start everything that feeds the SSE broadcaster (idempotent)"""
+    global _event_sources_started, _notes_watcher
+    with _event_sources_lock:
+        if _event_sources_started:
+            return
+        _event_sources_started = True
+    if HAS_DASHBOARD:
+        get_live_dashboard()
+    if HAS_STOCKS:
+        get_quote_poller()
+    NOTES_DIR.mkdir(parents=True, exist_ok=True)
+    snapshot_file = Path(snapshot_store.SNAPSHOT_FILE)
+    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+    _notes_watcher = FileWatcher([
+        (NOTES_DIR, "*.md"),
+        (snapshot_file.parent, snapshot_file.name),
+    ], publish_daystarter).start()
+
 def check_auth():
     """Simple token authentication"""
     token = request.headers.get('X-Auth-Token', '')
@@ -45,9 +148,7 @@ def check_auth():
 def index():
     """Serve dashboard HTML"""
     if HAS_DASHBOARD:
-        dash_mod.generate_html()
-        dashboard_path = Path.home() / ".openclaw" / "workspace" / "DASHBOARD.html"
-        return dashboard_path.read_text()
+        return dashboard_response()
 
     return "<h1>Dashboard not available</h1><p>Run 'python3 dashboard.py' first.</p>"
 
@@ -66,28 +167,63 @@ def api_status():
 
 @app.route('/api/dash')
 def api_dashboard():
-    """Generate dashboard and return HTML"""
+    """Return the current dashboard HTML"""
+    if HAS_DASHBOARD:
+        try:
+            return dashboard_response()
+        except Exception as e:
+            return jsonify({"status": "error", "message": str(e)}), 500
+    return jsonify({"status": "error", "message": "Dashboard module not available"}), 503
+
+@app.route('/api/board')
+def api_board():
+    """Kanban, projects and activity as JSON (?since=<version>&epoch=<epoch> for changes only)"""
     if HAS_DASHBOARD:
         try:
-            dash_mod.generate_html()
-            dashboard_path = Path.home() / ".openclaw" / "workspace" / "DASHBOARD.html"
-            return dashboard_path.read_text()
+            since = request.args.get('since', 0, type=int)
+            delta = get_live_dashboard().delta(since, request.args.get('epoch'))
+            return jsonify(dict(delta, status="success"))
         except Exception as e:
             return jsonify({"status": "error", "message": str(e)}), 500
     return jsonify({"status": "error", "message": "Dashboard module not available"}), 503
 
+@app.route('/api/events')
+def api_events():
+    """Server-Sent Events: board, stocks and daystarter updates as they happen"""
+    start_event_sources()
+    subscription = _broadcaster.subscribe()
+    if subscription is None:
+        # At the stream limit: the page sees the failed connection and polls instead
+        return Response(f"retry: {STREAM_REFUSED_RETRY_MS}\n\n", status=503, mimetype='text/event-stream',
+                        headers={'Retry-After': str(STREAM_REFUSED_RETRY_MS // 1000)})
+    hello = {"clients": _broadcaster.stats()["clients"]}
+    if HAS_DASHBOARD:
+        board = get_live_dashboard().board
+        hello.update(epoch=board.epoch, version=board.version)
+    return Response(_broadcaster.stream(subscription, hello), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # don't let a proxy buffer the stream
+    })
+
 @app.route('/api/stocks')
 def api_stocks():
-    """Get stock prices"""
+    """Get stock prices from the background poller (add ?history=1 for sparkline ticks)"""
     if HAS_STOCKS:
         try:
-            result = subprocess.run(
-                ["python3", str(Path.home() / ".openclaw" / "workspace" / "stock_prices.py")],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return jsonify({"status": "success", "stocks": result.stdout})
+            poller = get_quote_poller()
+            # Never fetch on the request thread - wait briefly for the poller instead
+            if not poller.wait_ready(STOCK_READY_TIMEOUT):
+                return jsonify({"status": "pending", "message": "Stock prices are still loading"}), 503
+            quotes, updated_at = poller.snapshot()
+            response = {
+                "status": "success",
+                "stocks": [quote._asdict() for quote in quotes],
+                "table": stock_mod.format_quotes(quotes),
+                "updated_at": updated_at
+            }
+            if request.args.get('history'):
+                response["history"] = poller.history()
+            return jsonify(response)
         except Exception as e:
             return jsonify({"status": "error", "message": str(e)}), 500
     return jsonify({"status": "error", "message": "Stock module not available"}), 503
@@ -112,16 +248,8 @@ def api_memo():
         data = request.get_json()
         note = data.get('note', '')
 
-        # Save to today's planning note
-        from datetime import datetime
-        NOTES_DIR = Path.home() / "Documents" / "DayStarters"
-        NOTES_DIR.mkdir(parents=True, exist_ok=True)
-
-        today = datetime.now().strftime("%Y-%m-%d")
-        note_path = NOTES_DIR / f"{today}.md"
-
-        with open(note_path, 'a') as f:
-            f.write(f"\n- {note}")
+        # Journal it (durable once this returns); it's folded into today's note shortly after
+        note_journal.capture(note)
 
         return jsonify({"status": "success", "message": "Note saved"})
     except Exception as e:
@@ -136,10 +264,47 @@ def api_calendar():
         "message": "Calendar integration available via daystarter command"
     })
 
-if __name__ == '__main__':
-    # Run Flask server
+def shutdown():
+    """Stop background work and end SSE streams so the server can drain"""
+    _broadcaster.close()
+    if _notes_watcher is not None:
+        _notes_watcher.stop(timeout=1)
+    if _live_dashboard is not None:
+        _live_dashboard.stop()
+    if _quote_poller is not None:
+        _quote_poller.stop(timeout=1)
+    note_journal.close()  # fold any journaled memos into their notes
+
+def main():
+    parser = argparse.ArgumentParser(description="Jarvis Remote Dashboard Server")
+    parser.add_argument('--host', default='0.0.0.0', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=5000, help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=wsgi_server.DEFAULT_WORKERS,
+                        help='Request worker threads (open live-update streams may use up to half)')
+    parser.add_argument('--dev', action='store_true', help="Use Flask's development server")
+    args = parser.parse_args()
+
     print("🌐 Jarvis Remote Dashboard Server starting...")
-    print("📱 Access from phone at: http://localhost:5000")
+    print(f"📱 Access from phone at: http://localhost:{args.port}")
     print("🔐 Auth token:", AUTH_TOKEN)
     print("⚠️  For secure external access, use HTTPS tunnel (ngrok)")
-    app.run(host='0.0.0.0', port=5000, debug=False)
+
+    # Render the dashboard, warm the stock buffer and start the file watchers
+    start_event_sources()
+
+    _broadcaster.max_clients = stream_limit(args.workers)
+
+    if args.dev:
+        try:
+            app.run(host=args.host, port=args.port, debug=False, threaded=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Stop the poller and watchers, and flush journaled notes into their files
+            shutdown()
+    else:
+        # The server runs shutdown() on SIGTERM/SIGINT, before it drains requests
+        wsgi_server.serve(app, host=args.host, port=args.port, workers=args.workers, on_shutdown=shutdown)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Response Cache - Persistent TTL cache for day-starter data sources
+Serves fresh entries from disk, serves stale ones instantly while refreshing
+in the background, and evicts least-recently-used entries past a size cap
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import http_client
+import timeservice
+
+CACHE_DIR = Path.home() / ".config" / "daystarter" / "cache"
+MAX_BYTES = 20 * 1024 * 1024
+
+# How long an entry is fresh, per source (seconds)
+TTLS = {
+    "weather": 15 * 60,
+    "news": 10 * 60,
+    "rss": 10 * 60,
+    "prices": 60,
+}
+DEFAULT_TTL = 10 * 60
+
+# How long past its TTL an entry may still be shown while a refresh runs
+STALE_TTLS = {
+    "weather": 2 * 60 * 60,
+    "news": 12 * 60 * 60,
+    "rss": 12 * 60 * 60,
+    "prices": 24 * 60 * 60,
+}
+DEFAULT_STALE_TTL = 60 * 60
+
+# Outside US market hours quotes don't move, so cache them for longer
+PRICES_CLOSED_TTL = 30 * 60
+
+def source_ttl(source):
+    """Freshness window for a source"""
+    if source == "prices" and not timeservice.market_open("US"):
+        return PRICES_CLOSED_TTL
+    return TTLS.get(source, DEFAULT_TTL)
+
+class ResponseCache:
+    """On-disk JSON cache with per-source TTLs and LRU eviction"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def _path(self, source, key):
+        digest = hashlib.sha1(f"{source}:{key}".encode()).hexdigest()[:20]
+        return self.directory / f"{source}-{digest}.json"
+
+    def get(self, source, key):
+        """Return (value, age_seconds) or None if there's no entry"""
+        path = self._path(source, key)
+        try:
+            entry = json.loads(path.read_text())
+            os.utime(path)  # mark as recently used for LRU eviction
+        except (OSError, ValueError):
+            return None
+        return entry["value"], time.time() - entry["stored_at"]
+
+    def set(self, source, key, value):
+        """Store a JSON-serialisable value"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"stored_at": time.time(), "value": value})
+        # Atomic replace so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(source, key))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def _evict(self):
+        """Drop least-recently-used entries until under the size cap"""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _refresh(self, source, key, fetcher):
+        try:
+            value = fetcher()
+            if value is not None:
+                self.set(source, key, value)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard((source, key))
+
+    def refresh_in_background(self, source, key, fetcher):
+        """Start a refresh unless one is already running for this key"""
+        with self._lock:
+            if (source, key) in self._refreshing:
+                return
+            self._refreshing.add((source, key))
+        # Not a daemon thread: a CLI run finishes the refresh before exiting
+        threading.Thread(
+            target=self._refresh,
+            args=(source, key, fetcher),
+            name=f"refresh-{source}"
+        ).start()
+
+    def fetch(self, source, key, fetcher, ttl=None, stale_ttl=None):
+        """
+        Return the cached value for (source, key) if fresh. A stale value is
+        returned immediately while a background refresh runs. Otherwise call
+        fetcher() and cache its result (None results are never cached).
+        """
+        ttl = source_ttl(source) if ttl is None else ttl
+        stale_ttl = STALE_TTLS.get(source, DEFAULT_STALE_TTL) if stale_ttl is None else stale_ttl
+
+        cached = self.get(source, key)
+        if cached is not None:
+            value, age = cached
+            if age < ttl:
+                return value
+            if age < ttl + stale_ttl:
+                self.refresh_in_background(source, key, fetcher)
+                return value
+
+        value = fetcher()
+        if value is not None:
+            self.set(source, key, value)
+        return value
+
+# Shared cache used by every fetcher in the process
+_cache = None
+
+def get_cache():
+    """Return the process-wide ResponseCache"""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
+
+def cached_fetch(source, key, fetcher, **kwargs):
+    """Fetch through the shared cache"""
+    return get_cache().fetch(source, key, fetcher, **kwargs)
+
+def cached_text(source, url, timeout=http_client.DEFAULT_TIMEOUT):
+    """GET a URL as text through the cache; non-2xx responses aren't cached"""
+    def fetch():
+        response = http_client.get(url, timeout=timeout)
+        return response.text() if response.ok else None
+    return cached_fetch(source, url, fetch)
+
+def cached_json(source, url, timeout=http_client.DEFAULT_TIMEOUT):
+    """GET a URL as JSON through the cache; non-2xx responses aren't cached"""
+    return cached_fetch(source, url, lambda: http_client.get_json(url, timeout=timeout))
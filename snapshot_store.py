@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store - Precomputed morning snapshot for the day-starter CLI
+A prefetch run (cron or --serve) fetches every section ahead of time and
+saves them to one file; the interactive run renders fresh sections from it
+instantly and only fetches the stale ones live
+"""
+
+import json
+import os
+import time
+
+import timeservice
+
+# Kept light on purpose: the --cached render path imports only this module,
+# so pathlib/tempfile/threads are left to the functions that write or fetch
+SNAPSHOT_FILE = os.path.expanduser("~/.config/daystarter/snapshot.json")
+SNAPSHOT_VERSION = 1
+
+# How long a prefetched section stays good enough to show (seconds)
+MAX_AGES = {
+    "weather": 60 * 60,
+    "calendar": 30 * 60,
+    "reminders": 30 * 60,
+    "news": 3 * 60 * 60,
+    "stocks": 15 * 60,
+}
+DEFAULT_MAX_AGE = 30 * 60
+
+PREFETCH_DEADLINE = 120   # a background run can afford to wait for slow sources
+SERVE_INTERVAL = 15 * 60
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    """Return {name: {"value", "fetched_at"}} from the snapshot file ({} if missing)"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != SNAPSHOT_VERSION:
+        return {}
+    return data.get("sections", {})
+
+def save_snapshot(values, path=SNAPSHOT_FILE, now=None, keep=None):
+    """
+    Merge fetched section values into the snapshot. None results are skipped,
+    as is anything keep(name, value) rejects (e.g. "unavailable" placeholders).
+    """
+    import tempfile
+
+    now = now or time.time()
+    sections = load_snapshot(path)
+    for name, value in values.items():
+        if value is not None and (keep is None or keep(name, value)):
+            sections[name] = {"value": value, "fetched_at": now}
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "sections": sections}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return sections
+
+def fresh_sections(sections, max_ages=None, now=None):
+    """Values still fresh enough to show: within max age and fetched today"""
+    now = now or time.time()
+    max_ages = max_ages or MAX_AGES
+    today = timeservice.local(now).date()
+
+    fresh = {}
+    for name, entry in sections.items():
+        fetched_at = entry.get("fetched_at", 0)
+        if now - fetched_at > max_ages.get(name, DEFAULT_MAX_AGE):
+            continue
+        if timeservice.local(fetched_at).date() != today:
+            continue
+        fresh[name] = entry.get("value")
+    return fresh
+
+def load_fresh(path=SNAPSHOT_FILE, max_ages=None):
+    """Shortcut: the fresh sections of the snapshot on disk"""
+    return fresh_sections(load_snapshot(path), max_ages)
+
+def load_today(path=SNAPSHOT_FILE):
+    """Every section prefetched today, however old (for the --cached fast path)"""
+    today = timeservice.today()
+    return {name: entry.get("value") for name, entry in load_snapshot(path).items()
+            if timeservice.local(entry.get("fetched_at", 0)).date() == today}
+
+def render_snapshot(sections, values, emit=print):
+    """Render (name, title, fetch, render) sections from snapshot values, in order, without fetching"""
+    for name, title, fetch, render in sections:
+        if name not in values:
+            emit(f"\n{title}:\n  Not prefetched yet (run with --prefetch)")
+            continue
+        try:
+            emit(render(values[name]))
+        except Exception:
+            emit(f"\n{title}:\n  Unable to display")
+
+def prefetch(sections, path=SNAPSHOT_FILE, deadline=PREFETCH_DEADLINE, keep=None):
+    """
+    Fetch every (name, title, fetch, render) section now and save the
+    snapshot. Returns the names of the sections that were saved.
+    """
+    from fetch_scheduler import run_sections
+
+    values = run_sections(sections, deadline=deadline, emit=lambda text: None)
+    save_snapshot(values, path, keep=keep)
+    return sorted(name for name, value in values.items()
+                  if value is not None and (keep is None or keep(name, value)))
+
+def serve(sections, interval=SERVE_INTERVAL, path=SNAPSHOT_FILE, deadline=PREFETCH_DEADLINE, keep=None):
+    """Keep the snapshot fresh by prefetching every `interval` seconds until Ctrl-C"""
+    try:
+        while True:
+            started = time.time()
+            ready = prefetch(sections, path, deadline, keep)
+            print(f"[{timeservice.now():%H:%M:%S}] snapshot updated: {', '.join(ready) or 'nothing'}")
+            time.sleep(max(0, interval - (time.time() - started)))
+    except KeyboardInterrupt:
+        pass
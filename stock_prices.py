@@ -2,11 +2,14 @@
 """
 Stock Price Fetcher - Get daily stock prices for major tech/TMT companies
 Uses yfinance library (free, no API key required)
+
+Import and call fetch_quotes() for typed Quote records; format_quotes()
+renders the printed table.
 """
 
 import subprocess
 import sys
-from pathlib import Path
+from typing import NamedTuple, Optional
 
 def install_yfinance():
     """Install yfinance if not present"""
@@ -22,52 +25,107 @@ def install_yfinance():
         import yfinance
         return True
 
-def get_stock_prices():
-    """Fetch stock prices for major tech/TMT companies"""
+class Quote(NamedTuple):
+    """Latest close and day change for one symbol (None fields = no data)"""
+    symbol: str
+    name: str
+    close: Optional[float] = None
+    change: Optional[float] = None
+    change_pct: Optional[float] = None
+
+    @property
+    def ok(self):
+        return self.close is not None and self.change is not None
+
+# Major tech/TMT stocks to track
+WATCHLIST = [
+    ("AAPL", "Apple"),
+    ("GOOGL", "Google/Alphabet"),
+    ("MSFT", "Microsoft"),
+    ("AMZN", "Amazon"),
+    ("META", "Meta"),
+    ("TSLA", "Tesla"),
+    ("NVDA", "Nvidia"),
+    ("VZ", "Verizon"),
+    ("T", "AT&T"),
+    ("VOD", "Vodafone"),
+    ("INTC", "Intel"),
+]
+
+def fetch_quotes(stocks=WATCHLIST):
+    """
+    Fetch the last two closes for every symbol in one multi-ticker request.
+    Returns a list of Quote records in watchlist order; the numeric fields
+    are None if a symbol had no data.
+    """
     try:
         import yfinance as yf
     except ImportError:
         install_yfinance()
         import yfinance as yf
+    import pandas as pd
+
+    symbols = [symbol for symbol, _ in stocks]
+
+    # 5 days so weekends/holidays still leave two trading sessions
+    data = yf.download(
+        symbols,
+        period="5d",
+        interval="1d",
+        group_by="column",
+        auto_adjust=False,
+        progress=False,
+        threads=True,
+    )
 
-    # Major tech/TMT stocks to track
-    stocks = [
-        ("AAPL", "Apple"),
-        ("GOOGL", "Google/Alphabet"),
-        ("MSFT", "Microsoft"),
-        ("AMZN", "Amazon"),
-        ("META", "Meta"),
-        ("TSLA", "Tesla"),
-        ("NVDA", "Nvidia"),
-        ("VZ", "Verizon"),
-        ("T", "AT&T"),
-        ("VOD", "Vodafone"),
-        ("INTC", "Intel"),
-    ]
-
-    print("\n💹 Stock Prices (US Close)")
-    print("-" * 50)
+    closes = data["Close"] if len(data) else pd.DataFrame(columns=symbols)
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(symbols[0])
+    closes = closes.reindex(columns=symbols)
 
+    quotes = []
     for symbol, name in stocks:
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2d")
+        # Each symbol's own last two sessions - with mixed exchanges or holidays
+        # the batch's latest row can be empty for some symbols
+        series = closes[symbol].dropna()
+        if len(series) < 2:
+            quotes.append(Quote(symbol, name))
+            continue
+        close, previous = float(series.iloc[-1]), float(series.iloc[-2])
+        change = close - previous
+        quotes.append(Quote(symbol, name, close, change, change / previous * 100 if previous else None))
+    return quotes
 
-            if len(hist) >= 2:
-                yesterday_close = hist.iloc[-2]['Close']
-                today_close = hist.iloc[-1]['Close']
-                change = today_close - yesterday_close
-                change_pct = (change / yesterday_close) * 100
+def format_quotes(quotes):
+    """Render quotes as the text table shown by the CLI"""
+    lines = ["\n💹 Stock Prices (US Close)", "-" * 50]
 
-                # Format with arrow
-                arrow = "📈" if change > 0 else "📉"
-                change_sign = "+" if change > 0 else ""
+    for quote in quotes:
+        symbol, name = quote.symbol, quote.name
+        if not quote.ok:
+            lines.append(f"✗ {symbol:6} | {name:15} | Error fetching data")
+            continue
 
-                print(f"{arrow} {symbol:6} | {name:15} | ${today_close:8.2f} | {change_sign}{change:+6.2f} ({change_sign}{change_pct:+5.2f}%)")
-        except Exception as e:
-            print(f"✗ {symbol:6} | {name:15} | Error fetching data")
+        # Format with arrow (the + format spec already signs the change)
+        arrow = "📈" if quote.change > 0 else "📉"
+
+        lines.append(
+            f"{arrow} {symbol:6} | {name:15} | ${quote.close:8.2f} | "
+            f"{quote.change:+6.2f} ({quote.change_pct:+5.2f}%)"
+        )
+
+    lines.append("-" * 50)
+    return "\n".join(lines)
+
+def get_stock_prices():
+    """Fetch and print stock prices for major tech/TMT companies"""
+    try:
+        quotes = fetch_quotes()
+    except Exception as e:
+        quotes = [Quote(symbol, name) for symbol, name in WATCHLIST]
 
-    print("-" * 50)
+    print(format_quotes(quotes))
+    return quotes
 
 if __name__ == "__main__":
     get_stock_prices()
@@ -0,0 +1,171 @@
+"""Recurrence expansion in ics_reader: RRULE parts, EXDATE, overrides and DST"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ics_reader
+import timeservice
+
+TZ = "Australia/Sydney"
+
+def vevent(uid, dtstart, summary, *extra):
+    lines = ["BEGIN:VEVENT", f"UID:{uid}", f"DTSTART;TZID={TZ}:{dtstart}", f"SUMMARY:{summary}"]
+    return "\r\n".join(lines + list(extra) + ["END:VEVENT"])
+
+class RecurrenceTest(unittest.TestCase):
+    def setUp(self):
+        timeservice.set_timezone(TZ)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "calendar.ics")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, *events):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("\r\n".join(["BEGIN:VCALENDAR", *events, "END:VCALENDAR"]) + "\r\n")
+
+    def days(self, first, last):
+        """{date: [(time, title)]} for days with events between first and last inclusive"""
+        found = {}
+        day = first
+        while day <= last:
+            events = ics_reader.today_events([self.path], day)
+            if events:
+                found[day] = events
+            day += timedelta(days=1)
+        return found
+
+    # --- COUNT / UNTIL / INTERVAL ---
+
+    def test_count_stops_after_n_occurrences(self):
+        self.write(vevent("c", "20261001T090000", "Daily", "RRULE:FREQ=DAILY;COUNT=3"))
+        self.assertEqual(sorted(self.days(date(2026, 9, 30), date(2026, 10, 6))),
+                         [date(2026, 10, 1), date(2026, 10, 2), date(2026, 10, 3)])
+
+    def test_until_is_inclusive(self):
+        self.write(vevent("u", "20261005T090000", "Weekly", "RRULE:FREQ=WEEKLY;UNTIL=20261019T090000"))
+        self.assertEqual(sorted(self.days(date(2026, 10, 1), date(2026, 11, 1))),
+                         [date(2026, 10, 5), date(2026, 10, 12), date(2026, 10, 19)])
+
+    def test_interval_keeps_phase_from_an_old_dtstart(self):
+        self.write(vevent("i", "20200101T090000", "Every other day", "RRULE:FREQ=DAILY;INTERVAL=2"))
+        # 2020-01-01 + an even number of days
+        self.assertEqual(sorted(self.days(date(2026, 10, 17), date(2026, 10, 21))),
+                         [date(2026, 10, 18), date(2026, 10, 20)])
+
+    def test_monthly_31st_skips_short_months(self):
+        self.write(vevent("m", "20260131T090000", "Month end", "RRULE:FREQ=MONTHLY;BYMONTHDAY=31"))
+        window = self.days(date(2026, 9, 1), date(2026, 12, 31))
+        self.assertEqual(sorted(window), [date(2026, 10, 31), date(2026, 12, 31)])
+
+    # --- BYDAY / BYMONTHDAY ---
+
+    def test_byday_ordinals(self):
+        self.write(
+            vevent("a", "20260112T090000", "Second Monday", "RRULE:FREQ=MONTHLY;BYDAY=2MO"),
+            vevent("b", "20260130T170000", "Last Friday", "RRULE:FREQ=MONTHLY;BYDAY=-1FR"),
+        )
+        window = self.days(date(2026, 10, 1), date(2026, 10, 31))
+        self.assertEqual(window, {
+            date(2026, 10, 12): [("09:00", "Second Monday")],
+            date(2026, 10, 30): [("17:00", "Last Friday")],
+        })
+
+    def test_byday_and_bymonthday_intersect(self):
+        self.write(vevent("f", "20260713T090000", "Monday the 13th", "RRULE:FREQ=MONTHLY;BYDAY=MO;BYMONTHDAY=13"))
+        window = self.days(date(2026, 7, 1), date(2027, 9, 30))
+        # Only months where the 13th is a Monday - not every Monday, not every 13th
+        self.assertEqual(sorted(window), [date(2026, 7, 13), date(2027, 9, 13)])
+
+    def test_yearly_byday_without_bymonth_spans_the_year(self):
+        self.write(
+            vevent("y", "20260105T090000", "Mondays", "RRULE:FREQ=YEARLY;BYDAY=MO"),
+            vevent("z", "20260101T090000", "Tenth Monday", "RRULE:FREQ=YEARLY;BYDAY=10MO"),
+        )
+        self.assertEqual(self.days(date(2026, 10, 19), date(2026, 10, 19)),
+                         {date(2026, 10, 19): [("09:00", "Mondays")]})
+        # The 10th Monday of the year, not of January
+        self.assertEqual(self.days(date(2026, 3, 9), date(2026, 3, 9)),
+                         {date(2026, 3, 9): [("09:00", "Mondays"), ("09:00", "Tenth Monday")]})
+
+    def test_yearly_with_bymonth_counts_ordinals_within_the_month(self):
+        self.write(vevent("t", "20201126T090000", "Thanksgiving", "RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=4TH"))
+        self.assertEqual(sorted(self.days(date(2026, 11, 1), date(2026, 11, 30))), [date(2026, 11, 26)])
+
+    def test_unsupported_parts_are_skipped(self):
+        self.write(vevent("s", "20261001T090000", "Last weekday",
+                          "RRULE:FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1"))
+        self.assertEqual(self.days(date(2026, 10, 1), date(2026, 10, 31)), {})
+
+    def test_filters_that_never_match_end_the_expansion(self):
+        # June has no 31st and February no 30th: nothing ever matches
+        self.write(
+            vevent("n", "20200101T090000", "Never", "RRULE:FREQ=DAILY;BYMONTH=6;BYMONTHDAY=31"),
+            vevent("w", "20200101T090000", "Never weekly", "RRULE:FREQ=WEEKLY;BYMONTH=2;BYMONTHDAY=30"),
+        )
+        self.assertEqual(self.days(date(2026, 10, 17), date(2026, 10, 19)), {})
+
+    def test_expansion_near_the_end_of_the_calendar(self):
+        start = datetime(9999, 12, 1, 9, tzinfo=timeservice.get_tz(TZ))
+        rule = ics_reader.parse_rrule("FREQ=WEEKLY;BYMONTH=2;BYMONTHDAY=30")
+        self.assertEqual(ics_reader.expand(start, rule, start, datetime.max.replace(tzinfo=start.tzinfo)), [])
+
+    # --- EXDATE and overrides ---
+
+    def test_exdate_removes_an_occurrence(self):
+        self.write(vevent("e", "20261012T090000", "Standup", "RRULE:FREQ=DAILY",
+                          f"EXDATE;TZID={TZ}:20261014T090000,20261016T090000"))
+        self.assertEqual(sorted(self.days(date(2026, 10, 13), date(2026, 10, 17))),
+                         [date(2026, 10, 13), date(2026, 10, 15), date(2026, 10, 17)])
+
+    def test_override_moved_out_of_the_window(self):
+        self.write(
+            vevent("o", "20261005T090000", "Standup", "RRULE:FREQ=WEEKLY"),
+            vevent("o", "20261120T090000", "Standup (moved)", f"RECURRENCE-ID;TZID={TZ}:20261019T090000"),
+        )
+        self.assertEqual(self.days(date(2026, 10, 19), date(2026, 10, 19)), {})
+        self.assertEqual(self.days(date(2026, 10, 26), date(2026, 10, 26)),
+                         {date(2026, 10, 26): [("09:00", "Standup")]})
+        self.assertEqual(self.days(date(2026, 11, 20), date(2026, 11, 20)),
+                         {date(2026, 11, 20): [("09:00", "Standup (moved)")]})
+
+    def test_override_moved_within_the_day_and_cancelled(self):
+        self.write(
+            vevent("o", "20261005T090000", "Standup", "RRULE:FREQ=DAILY"),
+            vevent("o", "20261019T140000", "Standup (late)", f"RECURRENCE-ID;TZID={TZ}:20261019T090000"),
+            vevent("o", "20261020T090000", "Standup", f"RECURRENCE-ID;TZID={TZ}:20261020T090000",
+                   "STATUS:CANCELLED"),
+        )
+        window = self.days(date(2026, 10, 19), date(2026, 10, 21))
+        self.assertEqual(window, {
+            date(2026, 10, 19): [("14:00", "Standup (late)")],
+            date(2026, 10, 21): [("09:00", "Standup")],
+        })
+
+    # --- DST ---
+
+    def test_wall_clock_time_holds_across_dst(self):
+        # Sydney moves to daylight time on 2026-10-04 and back on 2027-04-04
+        self.write(vevent("d", "20260901T090000", "Gym", "RRULE:FREQ=DAILY"))
+        for day in (date(2026, 10, 3), date(2026, 10, 4), date(2026, 10, 5), date(2027, 4, 4), date(2027, 4, 5)):
+            self.assertEqual(ics_reader.today_events([self.path], day), [("09:00", "Gym")], day)
+        starts = [s for s, _, _, _ in ics_reader.occurrences([self.path], *timeservice.day_window(date(2026, 10, 5)))]
+        self.assertEqual(starts[0].utcoffset(), timedelta(hours=11))
+
+    def test_event_in_another_zone_lands_on_the_local_day(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nUID:ny\r\n"
+                    "DTSTART;TZID=America/New_York:20261018T200000\r\nSUMMARY:NY call\r\n"
+                    "RRULE:FREQ=WEEKLY\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n")
+        # Sunday 20:00 in New York is Monday 11:00 in Sydney
+        self.assertEqual(ics_reader.today_events([self.path], date(2026, 10, 19)), [("11:00", "NY call")])
+        self.assertEqual(ics_reader.today_events([self.path], date(2026, 10, 18)), [])
+
+if __name__ == "__main__":
+    unittest.main()
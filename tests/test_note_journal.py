@@ -0,0 +1,52 @@
+"""Note journal compaction: notes land in the day's note exactly once"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from note_journal import NoteJournal
+
+DATE = "2026-10-19"
+
+class CompactionTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.journal = NoteJournal(os.path.join(self.tmp.name, "notes.journal"),
+                                   os.path.join(self.tmp.name, "notes"), compact_delay=60)
+        self.note_path = os.path.join(self.tmp.name, "notes", f"{DATE}.md")
+
+    def tearDown(self):
+        self.journal.close()
+        self.tmp.cleanup()
+
+    def note_lines(self):
+        with open(self.note_path, encoding="utf-8") as f:
+            return [line.split(" <!--")[0] for line in f.read().splitlines() if line]
+
+    def test_compact_moves_notes_and_empties_the_journal(self):
+        self.journal.append("buy milk", DATE)
+        self.journal.append("call Sam", DATE)
+        self.assertEqual(self.journal.compact(), 2)
+        self.assertEqual(self.note_lines(), ["- buy milk", "- call Sam"])
+        self.assertFalse(os.path.exists(self.journal.path))
+
+    def test_crash_then_append_then_compact_writes_each_note_once(self):
+        first = self.journal.append("buy milk", DATE)
+        second = self.journal.append("call Sam", DATE)
+        # Crash after the note was written but before the journal was rewritten
+        self.journal._append_to_note(DATE, [first, second])
+        self.journal.append("book dentist", DATE)
+        self.journal.compact()
+        self.assertEqual(self.note_lines(), ["- buy milk", "- call Sam", "- book dentist"])
+
+    def test_replay_is_a_no_op(self):
+        record = self.journal.append("buy milk", DATE)
+        self.journal.compact()
+        self.journal._append_to_note(DATE, [record])
+        self.assertEqual(self.note_lines(), ["- buy milk"])
+
+if __name__ == "__main__":
+    unittest.main()
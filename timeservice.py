@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Time Service - One clock for every day-starter section
+Wall-clock "now", today's window and market session boundaries in the
+user's time zone (config TIMEZONE), from zoneinfo with cached tz objects -
+no `date` subprocess, and the calendar, news and quotes all agree on the day
+"""
+
+from datetime import datetime, time, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    ZoneInfo = None
+
+DEFAULT_TIMEZONE = "Australia/Sydney"
+
+# Regular sessions: (time zone, open, close), Monday-Friday. Exchange
+# holidays aren't modelled - a holiday just looks like a quiet session
+MARKETS = {
+    "US": ("America/New_York", time(9, 30), time(16, 0)),
+    "ASX": ("Australia/Sydney", time(10, 0), time(16, 0)),
+}
+
+# "Overnight" news never covers less than this, even right after the ASX close
+MIN_OVERNIGHT = timedelta(hours=12)
+
+_tz_cache = {}
+_user_timezone = DEFAULT_TIMEZONE
+
+def get_tz(name):
+    """Cached tzinfo for an IANA name (system local time if it can't be loaded)"""
+    tz = _tz_cache.get(name)
+    if tz is None:
+        try:
+            tz = ZoneInfo(name)
+        except Exception:
+            tz = datetime.now().astimezone().tzinfo
+        _tz_cache[name] = tz
+    return tz
+
+def set_timezone(name):
+    """Set the user's time zone (the CLIs pass config TIMEZONE at startup)"""
+    global _user_timezone
+    _user_timezone = name or DEFAULT_TIMEZONE
+
+def user_tz():
+    return get_tz(_user_timezone)
+
+def now(tz=None):
+    """Aware current time in the user's time zone (or tz)"""
+    return datetime.now(tz or user_tz())
+
+def today():
+    """Today's date in the user's time zone"""
+    return now().date()
+
+def local(moment):
+    """An epoch timestamp or aware datetime as an aware datetime in the user's time zone"""
+    if isinstance(moment, (int, float)):
+        return datetime.fromtimestamp(moment, user_tz())
+    return moment.astimezone(user_tz())
+
+def day_window(day=None):
+    """Aware (start, end) of a calendar day in the user's time zone (DST-safe)"""
+    day = day or today()
+    tz = user_tz()
+    return (datetime.combine(day, time.min, tzinfo=tz),
+            datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz))
+
+def session(market="US", day=None):
+    """Aware (open, close) of a market's regular session on a day, None on weekends"""
+    tz_name, opens, closes = MARKETS[market]
+    tz = get_tz(tz_name)
+    day = day or now(tz).date()
+    if day.weekday() >= 5:
+        return None
+    return datetime.combine(day, opens, tzinfo=tz), datetime.combine(day, closes, tzinfo=tz)
+
+def market_open(market="US", at=None):
+    """True during the market's regular session"""
+    at = at or now()
+    bounds = session(market, at.astimezone(get_tz(MARKETS[market][0])).date())
+    return bounds is not None and bounds[0] <= at < bounds[1]
+
+def last_close(market="US", at=None):
+    """The most recent session close at or before `at`"""
+    at = at or now()
+    day = at.astimezone(get_tz(MARKETS[market][0])).date()
+    for back in range(8):
+        bounds = session(market, day - timedelta(days=back))
+        if bounds and bounds[1] <= at:
+            return bounds[1]
+    return None
+
+def next_open(market="ASX", at=None):
+    """The next session open after `at` (or the current one's, if it's open)"""
+    at = at or now()
+    day = at.astimezone(get_tz(MARKETS[market][0])).date()
+    for ahead in range(8):
+        bounds = session(market, day + timedelta(days=ahead))
+        if bounds and at < bounds[1]:
+            return bounds[0]
+    return None
+
+def overnight_window(at=None):
+    """
+    Aware (start, end) of overnight news for a morning reader in Sydney: from
+    the last ASX close - so the whole UK and US sessions are in - up to now
+    """
+    at = at or now()
+    start = last_close("ASX", at) or at - MIN_OVERNIGHT
+    return min(start, at - MIN_OVERNIGHT), at
+
+def parse_timestamp(text):
+    """Epoch seconds from an RFC 822 (RSS) or ISO 8601 (Atom, NewsAPI) date, None if unparseable"""
+    if not text:
+        return None
+    text = str(text).strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
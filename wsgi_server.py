@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+WSGI Server - Production serving for the dashboard Flask app
+Uses waitress when installed, otherwise a stdlib server that hands each
+connection to a fixed thread pool. Either way a slow request only ties up
+its own worker, and SIGTERM/SIGINT drain in-flight requests before exit
+"""
+
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+DEFAULT_WORKERS = 16
+SHUTDOWN_TIMEOUT = 10  # seconds to let in-flight requests finish
+
+try:
+    from waitress.server import create_server as create_waitress_server
+    HAS_WAITRESS = True
+except ImportError:
+    HAS_WAITRESS = False
+
+class ThreadPoolWSGIServer(WSGIServer):
+    """wsgiref server that processes requests on a bounded thread pool"""
+
+    allow_reuse_address = True
+
+    def __init__(self, address, app, workers=DEFAULT_WORKERS):
+        super().__init__(address, WSGIRequestHandler)
+        self.set_app(app)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wsgi")
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        future = self.pool.submit(self._process, request, client_address)
+        with self._inflight_lock:
+            self._inflight.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        with self._inflight_lock:
+            self._inflight.discard(future)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def drain(self, timeout=SHUTDOWN_TIMEOUT):
+        """Wait for in-flight requests, then stop the pool"""
+        with self._inflight_lock:
+            inflight = list(self._inflight)
+        _, pending = wait(inflight, timeout=timeout)
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        return len(pending)
+
+def _install_signal_handlers(stop):
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stop())
+
+def serve(app, host="0.0.0.0", port=5000, workers=DEFAULT_WORKERS, on_shutdown=None):
+    """
+    Serve app until SIGTERM/SIGINT. on_shutdown() runs first on the way out
+    so long-lived responses (SSE streams) can end before requests are drained.
+    """
+    def before_exit():
+        if on_shutdown:
+            try:
+                on_shutdown()
+            except Exception:
+                pass
+
+    if HAS_WAITRESS:
+        server = create_waitress_server(app, host=host, port=port, threads=workers)
+        print(f"   waitress, {workers} threads")
+
+        def stop():
+            before_exit()
+            raise SystemExit  # waitress' run() catches this and drains its threads
+
+        _install_signal_handlers(stop)
+        server.run()
+        server.close()
+        return
+
+    server = ThreadPoolWSGIServer((host, port), app, workers)
+    print(f"   thread-pool WSGI server, {workers} workers")
+
+    stopping = threading.Event()
+
+    def stop():
+        if stopping.is_set():
+            sys.exit(1)  # second Ctrl-C: don't wait
+        stopping.set()
+        before_exit()
+        # shutdown() blocks until serve_forever returns, so not from this (main) thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    _install_signal_handlers(stop)
+    try:
+        server.serve_forever()
+    finally:
+        pending = server.drain()
+        server.server_close()
+        if pending:
+            print(f"⚠️  {pending} request(s) still running at shutdown")